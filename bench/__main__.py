@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# ---------------------------------------------------------
+# 데이터/분석 파이프라인 벤치마크 (네트워크 없이 기록된 fixture 사용)
+# python -m bench [--net-ms 40] [--out run.json] [--compare base.json]
+# ---------------------------------------------------------
+WATCHLIST_SIZE = 500
+DEFAULT_THRESHOLD = 0.15  # p50 이 이 비율 이상 느려지면 회귀로 판단
+
+
+def _setup(tmp):
+    # 전역 저장소/캐시가 import 시점에 경로를 읽으므로 pause import 전에 설정
+    os.environ["PAUSE_OHLCV_DIR"] = os.path.join(tmp, "ohlcv")
+    os.environ["PAUSE_VERDICT_CACHE"] = os.path.join(tmp, "verdicts.sqlite")
+    os.environ["PAUSE_FUNDAMENTALS"] = os.path.join(tmp, "fundamentals.npy")
+    os.environ.pop("PAUSE_METRICS_LOG", None)
+    os.environ.pop("PAUSE_SHARED_CACHE", None)
+
+
+def measure(fn, iters, warmup=1, setup=None):
+    for _ in range(warmup):
+        if setup: setup()
+        fn()
+    samples = []
+    for _ in range(iters):
+        if setup: setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def report(samples, units=1):
+    # units: 한 번 실행에 처리한 항목 수 (처리량 계산용)
+    s = sorted(samples)
+    q = lambda p: s[min(len(s) - 1, int(round(p * (len(s) - 1))))] * 1000
+    return {
+        "iters": len(s),
+        "units": units,
+        "mean_ms": round(statistics.fmean(s) * 1000, 3),
+        "p50_ms": round(q(0.5), 3),
+        "p95_ms": round(q(0.95), 3),
+        "p99_ms": round(q(0.99), 3),
+        "units_per_s": round(units * len(s) / sum(s), 1) if sum(s) else None,
+    }
+
+
+def run_benchmarks(standins, iters, only=None):
+    from pause import charts, data, indicators, screener
+    from pause.cache import market_cache
+    from pause.fundamentals import FundamentalsTable
+    from pause.llm import chat_json, chat_json_batch, chat_json_stream
+    from pause.macro import macro_refresher
+    from pause.ohlcv_store import ohlcv_store
+    from pause.scheduler import PROVIDER_LIMITS, scheduler
+    from pause.prompts import (BATCH_SHORT_SYS_MSG, SHORT_SYS_MSG, SWING_SYS_MSG, batch_user_msg, compact_summary,
+                               short_user_msg, swing_user_msg)
+    from pause.verdict_cache import make_key
+
+    # 스탠드인 상대로는 속도 제한 없이 (제한 대기는 파이프라인 비용이 아님)
+    scheduler.set_limits({p: (1e9, 1e9) for p in PROVIDER_LIMITS})
+    fx = standins.fx
+    sym = fx.symbols[0]
+    macro_refresher.refresh()  # 매크로는 백그라운드 경로이므로 미리 채워 둠
+    client = standins.openai_client()
+    hist = fx.history[sym].iloc[-126:]
+    watch = [f"W{i:04d}" for i in range(WATCHLIST_SIZE)]
+    watch_hists = {t: fx.history[fx.symbol(t)].iloc[-126:] for t in watch}
+    panel = indicators.make_panel(watch_hists)
+    state = indicators.IndicatorState.from_panel({f: v.iloc[:-1] for f, v in panel.items()})
+    last_bar = {f: v.iloc[-1] for f, v in panel.items()}
+    short_content = json.dumps(fx.openai["short"])
+    batch_items = {r["ticker"]: compact_summary(r) for r in list(screener.screen(watch[:50]))}
+    reset_seen = standins._seen.clear
+    # 스냅샷 테이블은 별도 경로에 (analysis.* 는 실시간 조회 경로를 계속 측정)
+    fund_table = FundamentalsTable(os.path.join(os.path.dirname(ohlcv_store.root), "bench_fundamentals.npy"))
+    fund_table.build(fx.symbols)
+
+    def cold():
+        market_cache.invalidate()
+        shutil.rmtree(ohlcv_store.root, ignore_errors=True)
+
+    benches = {
+        # 단일 종목 분석 입력: 캐시/저장소 모두 비어 있음
+        "analysis.cold": (lambda: data.get_analysis_inputs(sym), 1, cold),
+        # 메모리 캐시 만료, 로컬 OHLCV 저장소에는 있음 (delta 조회)
+        "analysis.store_warm": (lambda: data.get_analysis_inputs(sym), 1, market_cache.invalidate),
+        # 메모리 캐시 적중
+        "analysis.warm": (lambda: data.get_analysis_inputs(sym), 1, None),
+        # 펀더멘털/실적일 스냅샷 조회 (인덱스 + 디코딩된 행 재사용)
+        "fundamentals.lookup": (lambda: fund_table.lookup(sym), 1, None),
+        "indicators.single": (lambda: (indicators.short_term_snapshot(hist), indicators.swing_snapshot(hist)), 1, None),
+        "indicators.watchlist": (lambda: screener.chunk_indicators(watch_hists), WATCHLIST_SIZE, None),
+        "indicators.incremental": (lambda: indicators.IndicatorState.update(state, last_bar) or state.snapshot(), WATCHLIST_SIZE, None),
+        # 차트: 전체 기록 -> 목표 봉 수로 OHLC 집계 + Figure 생성 (캐시 없이)
+        "chart.build": (lambda: charts.build_figure(*charts.prepare(fx.history[sym], "2Y", "1D", ema_span=indicators.EMA_SPAN)), 1, None),
+        "prompt.build": (lambda: (make_key(sym, "short", {"price": 230.0, "trend": "BULLISH", "stoch_k": 61.2, "vol_ratio": 118, "is_green": True, "vix": 17.1},
+                                           news=["a", "b", "c"], earnings_date="2026-10-29"),
+                                  short_user_msg(sym, 230.0, 228.1, "BULLISH", 61.2, 118, True, "VIX: 17.10", "- a\n- b"),
+                                  swing_user_msg(sym, "Moderate", 3500.0, 35.2, "Vanguard", 55.3, 101, "VIX: 17.10")), 1, None),
+        "verdict.parse": (lambda: chat_json(client, SHORT_SYS_MSG, "x"), 1, None),
+        "verdict.stream_parse": (lambda: list(chat_json_stream(client, SWING_SYS_MSG, "x")), 1, None),
+        "verdict.json_loads": (lambda: json.loads(short_content), 1, None),
+        # 50 종목 일괄 판정 (10 종목/요청, 일부 누락 -> 재시도)
+        "verdict.batch": (lambda: chat_json_batch(client, BATCH_SHORT_SYS_MSG, batch_items, lambda s: batch_user_msg(s, "VIX: 17.10")),
+                          len(batch_items), reset_seen),
+    }
+    out = {}
+    for name, (fn, units, setup) in benches.items():
+        if only and not any(name.startswith(o) for o in only): continue
+        n = max(5, iters // 10) if name in ("analysis.cold", "analysis.store_warm", "indicators.watchlist") else iters
+        out[name] = report(measure(fn, n, setup=setup), units)
+        print(f"{name:<26} p50 {out[name]['p50_ms']:>9.3f} ms  p95 {out[name]['p95_ms']:>9.3f} ms  "
+              f"{out[name]['units_per_s']:>10} /s", file=sys.stderr)
+    return out
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    # -> 회귀 목록 [(name, base_p50, cur_p50, ratio)]
+    regressions = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if not base or not base.get("p50_ms"): continue
+        ratio = cur["p50_ms"] / base["p50_ms"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "")
+        print(f"{name:<26} {base['p50_ms']:>9.3f} -> {cur['p50_ms']:>9.3f} ms  x{ratio:5.2f} {flag}", file=sys.stderr)
+        if ratio > 1 + threshold: regressions.append((name, base["p50_ms"], cur["p50_ms"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="PAUSE pipeline benchmarks on recorded fixtures")
+    p.add_argument("--iters", type=int, default=200)
+    p.add_argument("--net-ms", type=float, default=0.0, help="simulated round trip per stand-in call")
+    p.add_argument("--only", nargs="*", help="benchmark name prefixes to run")
+    p.add_argument("--out", help="write results JSON here")
+    p.add_argument("--compare", help="baseline results JSON; exit 1 on p50 regression")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = p.parse_args(argv)
+
+    tmp = tempfile.mkdtemp(prefix="pause-bench-")
+    try:
+        _setup(tmp)
+        from bench.standins import StandIns
+        standins = StandIns(net_ms=args.net_ms, drop_every=7)
+        standins.install()
+        results = run_benchmarks(standins, args.iters, args.only)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    doc = {"meta": {"ts": time.time(), "python": platform.python_version(), "machine": platform.machine(),
+                    "net_ms": args.net_ms, "iters": args.iters}, "results": results}
+    if args.out:
+        with open(args.out, "w") as f: json.dump(doc, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+        if compare(results, baseline.get("results", baseline), args.threshold): sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+
+from bench.standins import FIXTURES
+
+# ---------------------------------------------------------
+# 실제 yfinance / Google News 응답을 bench/fixtures 에 기록 (네트워크 필요)
+# python -m bench.record AAPL MSFT NVDA
+# OpenAI 응답(openai.json)은 비용 문제로 기록하지 않고 손으로 관리.
+# ---------------------------------------------------------
+def record(tickers, root=FIXTURES, period="2y"):
+    import pandas as pd
+    import yfinance as yf
+    from pause.clients import http_session
+    from pause.macro import MACRO_TICKERS
+    from pause.news import FEED_URL
+
+    os.makedirs(root, exist_ok=True)
+    for ticker in tickers:
+        t = yf.Ticker(ticker)
+        h = t.history(period=period)
+        h.index.name = "Date"
+        h[["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]].to_csv(os.path.join(root, f"history_{ticker}.csv"))
+        info = t.info or {}
+        cal = t.calendar if isinstance(t.calendar, dict) else {}
+        holders = t.institutional_holders
+        meta = {
+            "info": {k: info.get(k) for k in ("longName", "marketCap", "trailingPE", "revenueGrowth", "profitMargins")},
+            "calendar": {"Earnings Date": [str(d) for d in cal.get("Earnings Date", [])]},
+            "holders": [] if holders is None else holders[["Holder", "Shares"]].head(10).to_dict("records"),
+            "last_price": float(h["Close"].iloc[-1]),
+        }
+        with open(os.path.join(root, f"meta_{ticker}.json"), "w") as f: json.dump(meta, f, indent=1, default=str)
+        with open(os.path.join(root, f"news_{ticker}.xml"), "wb") as f: f.write(http_session().get(FEED_URL.format(ticker=ticker), timeout=10).content)
+        print(f"recorded {ticker}: {len(h)} bars")
+
+    macro = yf.download(MACRO_TICKERS, period="5d", progress=False)["Close"]
+    macro.index = pd.to_datetime(macro.index)
+    macro.index.name = "Date"
+    macro.to_csv(os.path.join(root, "macro.csv"))
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Record live fixtures for python -m bench")
+    p.add_argument("tickers", nargs="+")
+    p.add_argument("--period", default="2y")
+    args = p.parse_args(argv)
+    record([t.upper() for t in args.tickers], period=args.period)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import io
+import json
+import os
+import sys
+import time
+import types
+import zlib
+
+import pandas as pd
+
+# ---------------------------------------------------------
+# 로컬 stand-in (yfinance / Google News RSS / OpenAI)
+# bench/fixtures 의 기록된 응답을 네트워크 없이 돌려줌. net_ms 로 왕복 지연 흉내.
+# ---------------------------------------------------------
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class Fixtures:
+    def __init__(self, root=FIXTURES):
+        self.root = root
+        self.symbols = sorted(f[len("history_"):-4] for f in os.listdir(root) if f.startswith("history_"))
+        self.history = {s: pd.read_csv(os.path.join(root, f"history_{s}.csv"), index_col=0, parse_dates=[0]) for s in self.symbols}
+        for s, h in self.history.items():
+            h.index = pd.to_datetime(h.index, utc=True).tz_convert("America/New_York")
+        self.meta = {s: json.load(open(os.path.join(root, f"meta_{s}.json"))) for s in self.symbols}
+        self.news = {s: open(os.path.join(root, f"news_{s}.xml"), "rb").read() for s in self.symbols}
+        self.macro = pd.read_csv(os.path.join(root, "macro.csv"), index_col=0, parse_dates=[0])
+        self.openai = json.load(open(os.path.join(root, "openai.json")))
+
+    def symbol(self, ticker):
+        # 기록에 없는 종목은 결정적으로 하나에 매핑 (워치리스트 규모 벤치용)
+        ticker = ticker.upper()
+        if ticker in self.history: return ticker
+        return self.symbols[zlib.crc32(ticker.encode()) % len(self.symbols)]
+
+
+class StandIns:
+    def __init__(self, fixtures=None, net_ms=0.0, drop_every=0):
+        self.fx = fixtures or Fixtures()
+        self.net_ms = net_ms
+        self.drop_every = drop_every
+        self.calls = {}
+        self._seen = {}
+
+    def _net(self, kind):
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        if self.net_ms: time.sleep(self.net_ms / 1000)
+
+    # -- yfinance ------------------------------------------------
+    def yfinance_module(self):
+        standin = self
+
+        class FastInfo:
+            def __init__(self, sym): self.last_price = standin.fx.meta[sym]["last_price"]
+
+        class Ticker:
+            def __init__(self, ticker):
+                self.ticker = ticker
+                self._sym = standin.fx.symbol(ticker)
+
+            def history(self, period=None, start=None, **kw):
+                standin._net("yf.history")
+                h = standin.fx.history[self._sym]
+                if start is not None: return h[h.index >= pd.Timestamp(start, tz=h.index.tz)].copy()
+                n = {"1d": 1, "5d": 5, "1mo": 21, "3mo": 63, "6mo": 126, "1y": 252}.get(period or "1mo", len(h))
+                return h.iloc[-n:].copy()
+
+            @property
+            def fast_info(self):
+                standin._net("yf.quote")
+                return FastInfo(self._sym)
+
+            @property
+            def info(self):
+                standin._net("yf.info")
+                return dict(standin.fx.meta[self._sym]["info"])
+
+            @property
+            def calendar(self):
+                standin._net("yf.calendar")
+                cal = standin.fx.meta[self._sym]["calendar"]
+                return {"Earnings Date": [pd.Timestamp(d) for d in cal["Earnings Date"]]}
+
+            @property
+            def institutional_holders(self):
+                standin._net("yf.holders")
+                return pd.DataFrame(standin.fx.meta[self._sym]["holders"])
+
+        def download(tickers, period="5d", group_by=None, **kw):
+            standin._net("yf.download")
+            tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+            if all(t in standin.fx.macro.columns for t in tickers):
+                return pd.concat({"Close": standin.fx.macro[tickers]}, axis=1)
+            frames = {t: Ticker(t).history(period=period)[["Open", "High", "Low", "Close", "Volume"]] for t in tickers}
+            return pd.concat(frames, axis=1)
+
+        mod = types.ModuleType("yfinance")
+        mod.Ticker = Ticker
+        mod.download = download
+        return mod
+
+    # -- RSS -------------------------------------------------------
+    def http_session(self):
+        standin = self
+
+        class Response:
+            def __init__(self, content, status_code=200, headers=None):
+                self.content = content
+                self.status_code = status_code
+                self.headers = headers or {}
+                self.raw = io.BytesIO(content)
+            def raise_for_status(self): pass
+            def close(self): pass
+
+        class Session:
+            def get(self, url, timeout=None, headers=None, **kw):
+                standin._net("news.rss")
+                q = url.split("q=", 1)[1].split("+", 1)[0]
+                body = standin.fx.news[standin.fx.symbol(q)]
+                etag = '"%08x"' % zlib.crc32(body)
+                if (headers or {}).get("If-None-Match") == etag: return Response(b"", 304)
+                return Response(body, headers={"ETag": etag})
+
+        return Session()
+
+    # -- OpenAI ----------------------------------------------------
+    def openai_client(self, token_chars=4):
+        standin = self
+
+        def msg(content):
+            return types.SimpleNamespace(content=content)
+
+        def create(model=None, messages=None, response_format=None, stream=False, **kw):
+            standin._net("openai")
+            if "For EACH stock" in messages[0]["content"]:
+                return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg(standin.batch_answer(messages[1]["content"])))])
+            mode = "swing" if "Swing" in messages[0]["content"] else "short"
+            content = json.dumps(standin.fx.openai[mode])
+            if not stream:
+                return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg(content))])
+            return (types.SimpleNamespace(choices=[types.SimpleNamespace(delta=msg(content[i:i + token_chars]))])
+                    for i in range(0, len(content), token_chars))
+
+        completions = types.SimpleNamespace(create=create)
+        return types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+    def batch_answer(self, user_msg):
+        # 가짜 모델: 요약 줄마다 결정적 판정. drop_every 번째 종목은 첫 요청에서 누락 (재시도 경로 검증용)
+        results = []
+        for line in user_msg.split("Stocks:", 1)[-1].strip().splitlines():
+            parts = line.split()
+            ticker, price = parts[0], float(parts[1].lstrip("$"))
+            self._seen[ticker] = self._seen.get(ticker, 0) + 1
+            if self.drop_every and self._seen[ticker] == 1 and zlib.crc32(ticker.encode()) % self.drop_every == 0: continue
+            go = "BULLISH" in parts and "GREEN" in parts
+            results.append({"ticker": ticker, "verdict": "GO" if go else "WAIT", "stop_loss": round(price * 0.98, 2),
+                            "target": round(price * 1.02, 2), "reasoning": [f"{ticker} trend {'up' if go else 'unclear'}."]})
+        return json.dumps({"results": results})
+
+    def install(self):
+        # yfinance 를 stand-in 모듈로 교체하고 공유 HTTP 세션을 가짜 세션으로 교체
+        sys.modules["yfinance"] = self.yfinance_module()
+        from pause import clients
+        clients._session = self.http_session()
@@ -0,0 +1,167 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pause import indicators
+
+# ---------------------------------------------------------
+# GO/WAIT 규칙 오프라인 백테스트
+# LLM 대신 결정적 규칙으로 판정하고, 앱의 safe_float 기본값과 같은 목표/손절을 사용:
+#   단타  목표 +2% / 손절 -2%, 다음 1봉 (target_tomorrow)
+#   스윙  목표 볼린저 상단 / 손절 볼린저 하단, 최대 20봉
+# 지표는 앱과 같은 indicators 정의를 전체 기간에 한 번에 계산 (rolling 이라 미래 데이터 미사용).
+# 종목마다 한 번에 한 포지션: 보유 중에 나온 신호는 건너뜀 (청산 봉부터 다시 진입 가능).
+# ---------------------------------------------------------
+SHORT_TP, SHORT_SL, SHORT_HORIZON = 0.02, 0.02, 1
+SWING_HORIZON = 20
+STOCH_OVERBOUGHT = 80
+SWING_RSI_MAX = 40
+BARS_PER_YEAR = 252
+
+
+def short_signals(close, open_, ind):
+    # 상승 추세 + 양봉 + 과매수 아님 + 거래량 평균 이상 (screener.rank_candidates 와 같은 기준)
+    return (close > ind["ema5"]) & (close > open_) & (ind["stoch_k"] < STOCH_OVERBOUGHT) & (ind["vol_ratio"] >= 100)
+
+
+def swing_signals(close, ind):
+    # 과매도 RSI + 밴드 하단~중앙 사이 (손절 < 진입 < 목표 가 되는 구간만)
+    mid = (ind["bb_lower"] + ind["bb_upper"]) / 2
+    return (ind["rsi"] <= SWING_RSI_MAX) & (close > ind["bb_lower"]) & (close < mid)
+
+
+def bracket_returns(entry, target, stop, open_, high, low, close, horizon):
+    # 신호 봉 t 의 종가 진입 후 t+1..t+horizon 동안 먼저 닿는 쪽으로 청산.
+    # 시가가 손절/목표를 넘어 갭으로 열리면 그 시가에 체결 (손절 min(시가, 손절), 목표 max(시가, 목표)).
+    # 같은 봉에 둘 다 닿으면 갭으로 목표 위에서 연 경우만 목표, 나머지는 손절 우선.
+    # 둘 다 안 닿으면 horizon 마지막 종가 청산. -> (수익률, 목표 도달 여부, 보유 봉 수), 길이 len(entry) - horizon
+    n = len(close) - horizon
+    if n <= 0: return np.empty(0), np.empty(0, dtype=bool), np.empty(0, dtype=int)
+    win = np.lib.stride_tricks.sliding_window_view
+    op, hi, lo = win(open_[1:], horizon)[:n], win(high[1:], horizon)[:n], win(low[1:], horizon)[:n]
+    tgt, stp = target[:n, None], stop[:n, None]
+    hit_sl, hit_tp = lo <= stp, hi >= tgt
+    any_sl, any_tp = hit_sl.any(axis=1), hit_tp.any(axis=1)
+    first_sl = np.where(any_sl, hit_sl.argmax(axis=1), horizon)
+    first_tp = np.where(any_tp, hit_tp.argmax(axis=1), horizon)
+    sl_open, tp_open = (np.take_along_axis(op, np.minimum(j, horizon - 1)[:, None], axis=1)[:, 0] for j in (first_sl, first_tp))
+    tp_first = any_tp & ((first_tp < first_sl) | ((first_tp == first_sl) & (tp_open >= target[:n])))
+    sl_first = any_sl & ~tp_first
+    exit_px = np.where(tp_first, np.maximum(tp_open, target[:n]),
+                       np.where(sl_first, np.minimum(sl_open, stop[:n]), close[horizon:][:n]))
+    held = np.where(tp_first, first_tp + 1, np.where(sl_first, first_sl + 1, horizon))
+    return exit_px / entry[:n] - 1, tp_first, held
+
+
+def entries(sig, held):
+    # 신호 봉 중 이전 포지션이 청산된 뒤의 것만 -> 진입 봉 인덱스
+    out, free = [], 0
+    for i in np.flatnonzero(sig):
+        if i < free: continue
+        out.append(i)
+        free = i + held[i]
+    return np.array(out, dtype=int)
+
+
+def evaluate(ticker, df):
+    # 한 종목 전체 기간 -> {mode: 집계}
+    ind = {k: v.iloc[:, 0].to_numpy(dtype=float)
+           for k, v in indicators.compute_panel(indicators.make_panel({ticker: df})).items()}
+    o, h, l, c = (df[f].to_numpy(dtype=float) for f in ("Open", "High", "Low", "Close"))
+    out = {"ticker": ticker, "bars": len(c)}
+    with np.errstate(invalid="ignore"):
+        plans = {
+            "short": (short_signals(c, o, ind), c * (1 + SHORT_TP), c * (1 - SHORT_SL), SHORT_HORIZON),
+            "swing": (swing_signals(c, ind), ind["bb_upper"], ind["bb_lower"], SWING_HORIZON),
+        }
+        for mode, (sig, tgt, stp, horizon) in plans.items():
+            ret, hit, held = bracket_returns(c, tgt, stp, o, h, l, c, horizon)
+            idx = entries(sig[:len(ret)], held)
+            out[mode] = {"trades": len(idx), "hits": int(hit[idx].sum()),
+                         "wins": int((ret[idx] > 0).sum()), "pnl": float(ret[idx].sum()),
+                         "bars_held": int(held[idx].sum()), "returns": ret[idx].tolist()}
+    return out
+
+
+def _evaluate_job(args):
+    ticker, df = args
+    try:
+        return evaluate(ticker, df)
+    except Exception:
+        return None
+
+
+def summarize(results):
+    summary = {}
+    bars = sum(r["bars"] for r in results)
+    for mode in ("short", "swing"):
+        rets = np.array([x for r in results for x in r[mode]["returns"]])
+        trades = len(rets)
+        summary[mode] = {
+            "tickers": len(results),
+            "ticker_years": round(bars / BARS_PER_YEAR, 1),
+            "trades": trades,
+            "hit_rate": round(sum(r[mode]["hits"] for r in results) / trades, 4) if trades else None,
+            "win_rate": round(float((rets > 0).mean()), 4) if trades else None,
+            "avg_ret_pct": round(float(rets.mean()) * 100, 3) if trades else None,
+            "exposure": round(sum(r[mode]["bars_held"] for r in results) / bars, 4) if bars else None,
+            # 종목당 1단위, 겹치지 않는 거래의 단순 합 (복리 아님)
+            "total_pnl_pct": round(float(rets.sum()) * 100, 2),
+        }
+    return summary
+
+
+def run(histories, workers=None):
+    # {ticker: OHLCV DataFrame} -> (종목별 결과, 요약). workers=1 이면 현재 프로세스에서 실행
+    jobs = [(t, h) for t, h in histories.items() if h is not None and len(h) > indicators.IndicatorState.WINDOW + SWING_HORIZON]
+    if workers == 1:
+        results = [_evaluate_job(j) for j in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_evaluate_job, jobs, chunksize=max(1, len(jobs) // 64)))
+    results = [r for r in results if r]
+    return results, summarize(results)
+
+
+def load_histories(tickers, source="yahoo", period="5y"):
+    # store 는 앱이 조회한 종목만, 최대 KEEP_DAYS(2년)까지 -> 긴 기간 백테스트는 yahoo
+    if source == "store":
+        from pause.ohlcv_store import ohlcv_store
+        return {t: ohlcv_store.load(t) for t in tickers}
+    from pause.screener import download_histories, CHUNK_SIZE
+    out = {}
+    for i in range(0, len(tickers), CHUNK_SIZE):
+        out.update(download_histories(tickers[i:i + CHUNK_SIZE], period))
+    return out
+
+
+# ---------------------------------------------------------
+# CLI: python -m pause.backtest watchlist.txt [--period 5y] [--source store] [--workers 8]
+# ---------------------------------------------------------
+def main(argv=None):
+    from pause.screener import parse_watchlist
+    p = argparse.ArgumentParser(description="PAUSE GO/WAIT rule backtest")
+    p.add_argument("watchlist", help="file with tickers (comma/space/newline separated), or '-' for stdin")
+    p.add_argument("--source", default="yahoo", choices=["store", "yahoo"],
+                   help="fresh Yahoo download (default) or the local OHLCV store (only tickers the app has seen, at most 2 years)")
+    p.add_argument("--period", default="5y", help="history length when --source yahoo")
+    p.add_argument("--workers", type=int, default=None)
+    args = p.parse_args(argv)
+
+    text = sys.stdin.read() if args.watchlist == "-" else open(args.watchlist).read()
+    tickers = parse_watchlist(text)
+    start = time.time()
+    hists = load_histories(tickers, args.source, args.period)
+    loaded = time.time()
+    results, summary = run(hists, args.workers)
+    print(f"loaded {sum(h is not None for h in hists.values())}/{len(tickers)} in {loaded - start:.1f}s, "
+          f"evaluated {len(results)} in {time.time() - loaded:.1f}s", file=sys.stderr)
+    for mode, s in summary.items():
+        print(mode, " ".join(f"{k}={v}" for k, v in s.items()))
+
+
+if __name__ == "__main__":
+    main()
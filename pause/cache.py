@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+
+from pause.shared_cache import shared_cache
+
+# ---------------------------------------------------------
+# 데이터 종류별 TTL (초)
+# ---------------------------------------------------------
+DEFAULT_TTLS = {
+    "history": 10 * 60,
+    "info": 6 * 3600,
+    "calendar": 6 * 3600,
+    "holders": 12 * 3600,
+    "chart": 10 * 60,
+}
+
+# 워커 간 공유 캐시(설정된 경우)로도 올리는 종류. 차트 Figure 는 프로세스 로컬.
+SHARED_KINDS = frozenset({"history", "info", "calendar", "holders"})
+
+_MISS = object()
+
+
+class _Flight:
+    # 같은 키에 대한 진행 중인 fetch (동시 요청은 이 결과를 기다림)
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    def __init__(self, maxsize=1024, ttls=None, shared=None, shared_kinds=SHARED_KINDS):
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.shared = shared
+        self.shared_kinds = shared_kinds
+        self._data = OrderedDict()  # (kind, key) -> (expires_at, value)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _count(self, kind, name):
+        s = self._stats.setdefault(kind, {"hits": 0, "misses": 0, "coalesced": 0, "shared_hits": 0, "evictions": 0, "expired": 0})
+        s[name] += 1
+
+    def _lookup(self, k):
+        item = self._data.get(k)
+        if item is None: return _MISS
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[k]
+            self._count(k[0], "expired")
+            return _MISS
+        self._data.move_to_end(k)
+        return value
+
+    def get(self, kind, key, default=None):
+        with self._lock:
+            value = self._lookup((kind, key))
+            if value is _MISS:
+                self._count(kind, "misses")
+                return default
+            self._count(kind, "hits")
+            return value
+
+    def set(self, kind, key, value, ttl=None):
+        if ttl is None: ttl = self.ttls.get(kind, 60)
+        k = (kind, key)
+        with self._lock:
+            self._data[k] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(k)
+            while len(self._data) > self.maxsize:
+                old, _ = self._data.popitem(last=False)
+                self._count(old[0], "evictions")
+
+    def invalidate(self, kind=None, key=None):
+        with self._lock:
+            for k in list(self._data):
+                if (kind is None or k[0] == kind) and (key is None or k[1] == key):
+                    del self._data[k]
+        # 공유 캐시는 특정 키 무효화만 전파 (다른 워커의 전체 캐시를 지우지 않음)
+        if self.shared is not None and kind in self.shared_kinds and key is not None:
+            self.shared.delete(kind, key)
+
+    def get_or_fetch(self, kind, key, fetch, ttl=None):
+        # None 결과(조회 실패)는 캐시하지 않음
+        k = (kind, key)
+        with self._lock:
+            value = self._lookup(k)
+            if value is not _MISS:
+                self._count(kind, "hits")
+                return value
+            flight = self._inflight.get(k)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[k] = _Flight()
+                self._count(kind, "misses")
+            else:
+                self._count(kind, "coalesced")
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None: raise flight.error
+            return flight.value
+
+        try:
+            if ttl is None: ttl = self.ttls.get(kind, 60)
+            if self.shared is not None and kind in self.shared_kinds:
+                # 프로세스 안에서는 이 스레드만, 워커 간에는 잠금을 잡은 한 워커만 fetch()
+                fetched = []
+                def run():
+                    fetched.append(True)
+                    return fetch()
+                flight.value, ttl = self.shared.fetch_through(kind, key, run, ttl)
+                if not fetched:
+                    with self._lock: self._count(kind, "shared_hits")
+            else:
+                flight.value = fetch()
+            if flight.value is not None: self.set(kind, key, flight.value, ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(k, None)
+            flight.event.set()
+
+    def stats(self):
+        with self._lock:
+            out = {kind: dict(s) for kind, s in self._stats.items()}
+            out["_size"] = len(self._data)
+            out["_maxsize"] = self.maxsize
+            return out
+
+
+# 프로세스 전역 캐시 (Streamlit 세션 간 공유, PAUSE_SHARED_CACHE 가 있으면 워커 간에도)
+market_cache = TTLCache(shared=shared_cache)
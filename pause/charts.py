@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from pause.cache import market_cache
+
+# ---------------------------------------------------------
+# 서버측 차트 파이프라인
+# 기간 자르기 -> 봉 간격 리샘플 -> 목표 봉 수로 OHLC 집계 -> Figure 캐시
+# (점을 버리지 않고 구간별 시가/고가/저가/종가/거래량 합으로 합침)
+# ---------------------------------------------------------
+PERIODS = {"1M": 1, "3M": 3, "6M": 6, "1Y": 12, "2Y": 24}  # 개월
+STORE_PERIOD = "2y"  # 분석 시 로컬 저장소에 채워 두는 길이 (가장 긴 PERIODS)
+COVER_SLACK = pd.Timedelta(days=7)  # 휴장일 등으로 시작이 조금 늦어도 그 기간을 덮은 것으로 봄
+INTERVALS = {"1D": None, "1W": "W-FRI", "1M": "MS"}
+DEFAULT_PERIOD = "6M"
+DEFAULT_INTERVAL = "1D"
+TARGET_BARS = 150
+OHLC_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+
+def available_periods(df):
+    # 데이터가 실제로 덮는 기간만 (가장 짧은 기간은 항상 포함)
+    names = list(PERIODS)
+    if df is None or df.empty: return names[:1]
+    end = df.index[-1]
+    return [p for i, p in enumerate(names) if i == 0 or df.index[0] <= end - pd.DateOffset(months=PERIODS[p]) + COVER_SLACK]
+
+
+def clip_period(df, period):
+    if period not in PERIODS or df.empty: return df
+    return df[df.index >= df.index[-1] - pd.DateOffset(months=PERIODS[period])]
+
+
+def resample_interval(df, interval):
+    rule = INTERVALS.get(interval)
+    if rule is None: return df
+    cols = {c: a for c, a in OHLC_AGG.items() if c in df.columns}
+    return df[list(cols)].resample(rule).agg(cols).dropna(subset=["Close"])
+
+
+def downsample(df, target=TARGET_BARS, extra=None):
+    # 연속된 k 봉씩 하나로 OHLC 집계 (k = ceil(n / target)). 인덱스는 각 구간의 첫 시각.
+    # extra: 같은 인덱스의 보조 Series (EMA 등) -> 구간 마지막 값
+    n = len(df)
+    if n <= target: return df, extra
+    k = math.ceil(n / target)
+    groups = np.arange(n) // k
+    cols = {c: a for c, a in OHLC_AGG.items() if c in df.columns}
+    out = df[list(cols)].groupby(groups).agg(cols)
+    out.index = df.index[::k]
+    if extra is not None:
+        extra = pd.Series(extra.to_numpy()[np.minimum(np.arange(len(out)) * k + k - 1, n - 1)], index=out.index, name=extra.name)
+    return out, extra
+
+
+def prepare(df, period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL, target=TARGET_BARS, ema_span=None):
+    # -> (표시용 OHLC DataFrame, EMA Series 또는 None)
+    from pause.indicators import ema
+    bars = resample_interval(clip_period(df, period), interval)
+    line = ema(bars['Close'], ema_span) if ema_span else None
+    return downsample(bars, target, line)
+
+
+def build_figure(bars, line=None, line_name="EMA", height=400):
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[go.Candlestick(x=bars.index, open=bars['Open'], high=bars['High'], low=bars['Low'], close=bars['Close'])])
+    if line is not None: fig.add_trace(go.Scatter(x=line.index, y=line, line=dict(color='orange'), name=line_name))
+    fig.update_layout(height=height, margin=dict(l=0,r=0,t=0,b=0), xaxis_rangeslider_visible=False)
+    return fig
+
+
+def cached_figure(ticker, df, period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL, target=TARGET_BARS, ema_span=None):
+    # 같은 데이터(마지막 봉/길이) + 같은 보기 설정이면 만들어 둔 Figure 재사용
+    key = (ticker, str(df.index[-1]), len(df), period, interval, target, ema_span)
+    def build():
+        bars, line = prepare(df, period, interval, target, ema_span)
+        return build_figure(bars, line, f"EMA {ema_span}")
+    return market_cache.get_or_fetch("chart", key, build)
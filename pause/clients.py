@@ -0,0 +1,48 @@
+import threading
+
+# ---------------------------------------------------------
+# 공유 네트워크 클라이언트 (프로세스 전역, Streamlit 세션 간 공유)
+# ---------------------------------------------------------
+HTTP_POOL_SIZE = 16  # fetch 워커 풀과 같은 크기
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.3
+OPENAI_TIMEOUT = 60
+OPENAI_RETRIES = 0  # 429/5xx 재시도는 pause.scheduler 가 담당 (SDK 내부 재시도는 슬롯을 쥔 채 429 를 숨김)
+
+_lock = threading.Lock()
+_session = None
+_openai = {}  # api_key -> OpenAI
+
+
+def http_session():
+    # keep-alive 연결 풀 + 재시도/백오프 정책을 가진 requests.Session
+    global _session
+    if _session is not None: return _session
+    with _lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            # 429 는 재시도하지 않고 응답 그대로 -> 스케줄러가 Retry-After 로 제공자 백오프
+            # (urllib3 는 Retry-After 가 있는 429 를 forcelist 와 무관하게 재시도하므로 헤더 처리도 끔)
+            retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF, status_forcelist=(500, 502, 503, 504),
+                          allowed_methods=("GET", "HEAD"), respect_retry_after_header=False)
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            s = requests.Session()
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.headers["User-Agent"] = "Mozilla/5.0 (PAUSE)"
+            _session = s
+    return _session
+
+
+def openai_client(api_key):
+    # API 키별로 하나의 OpenAI 클라이언트 (내부 httpx 연결 풀 재사용)
+    client = _openai.get(api_key)
+    if client is not None: return client
+    with _lock:
+        client = _openai.get(api_key)
+        if client is None:
+            from openai import OpenAI
+            client = _openai[api_key] = OpenAI(api_key=api_key, timeout=OPENAI_TIMEOUT, max_retries=OPENAI_RETRIES)
+    return client
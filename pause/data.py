@@ -0,0 +1,77 @@
+from pause.cache import market_cache
+from pause.charts import STORE_PERIOD
+from pause.fetch import gather
+from pause.fundamentals import earnings_warning, fundamentals_table, parse_fundamentals
+from pause.macro import macro_refresher
+from pause.metrics import metrics
+from pause.news import news_service
+from pause.ohlcv_store import ohlcv_store
+from pause.scheduler import scheduler
+
+# ---------------------------------------------------------
+# 분석 입력 데이터 (히스토리 / 펀더멘털 / 뉴스 / 매크로)
+# Streamlit 과 무관하게 import 가능 (벤치마크, CLI 에서 재사용)
+# ---------------------------------------------------------
+def _ticker(ticker):
+    import yfinance as yf
+    return yf.Ticker(ticker)
+
+def get_macro_data():
+    # 백그라운드 갱신기의 마지막 스냅샷 (요청 경로에서 다운로드 없음)
+    macro_refresher.start()
+    return macro_refresher.read()
+
+def _fetch_history(ticker):
+    # 로컬 저장소에서 delta 만 갱신 (Yahoo 장애 시 저장된 봉 사용). 저장소는 차트용 긴 구간까지 채움
+    return ohlcv_store.history(ticker, '6mo', cover=STORE_PERIOD)
+
+def _fetch_info(ticker):
+    return scheduler.call("yahoo", lambda: _ticker(ticker).info)
+
+def _fetch_calendar(ticker):
+    return scheduler.call("yahoo", lambda: _ticker(ticker).calendar)
+
+def _fetch_holders(ticker):
+    return scheduler.call("yahoo", lambda: _ticker(ticker).institutional_holders)
+
+def _data_jobs(ticker, snap=None):
+    # 스냅샷 테이블에 최신 펀더멘털이 있으면 info/calendar/holders 조회 생략
+    jobs = {"history": lambda: metrics.cached("history", market_cache, "history", ticker, lambda: _fetch_history(ticker))}
+    if snap is None:
+        jobs["info"] = lambda: metrics.cached("info", market_cache, "info", ticker, lambda: _fetch_info(ticker))
+        jobs["calendar"] = lambda: metrics.cached("calendar", market_cache, "calendar", ticker, lambda: _fetch_calendar(ticker))
+        jobs["holders"] = lambda: metrics.cached("holders", market_cache, "holders", ticker, lambda: _fetch_holders(ticker))
+    return jobs
+
+def _snapshot(ticker):
+    with metrics.timed("fundamentals.lookup") as t:
+        snap = fundamentals_table.lookup(ticker)
+        t.cache = "miss" if snap is None else "hit"
+    return snap
+
+def _build_data(ticker, r, snap=None):
+    h = r.get('history')
+    if h is None: return None
+    if snap is None: snap = parse_fundamentals(ticker, r.get('info'), r.get('calendar'), r.get('holders'))
+    e_date = snap['earnings_date']
+
+    return {
+        'hist': h, 
+        'price': h['Close'].iloc[-1], 
+        'name': snap['name'],
+        'earnings_warning': earnings_warning(e_date),
+        'earnings_date': "N/A" if e_date is None else str(e_date),
+        'fund': snap['fund'],
+        'whales': snap['whales']
+    }
+
+def get_analysis_inputs(ticker, with_news=True):
+    # 히스토리/펀더멘털/뉴스를 한 번에 병렬 조회 (가장 느린 소스 기준으로 대기), 매크로는 백그라운드 스냅샷
+    ticker = ticker.strip().upper()
+    snap = _snapshot(ticker)
+    jobs = _data_jobs(ticker, snap)
+    if with_news: jobs["news"] = lambda: news_service.get(ticker)
+    r = gather(jobs)
+    try: d = _build_data(ticker, r, snap)
+    except: d = None
+    return d, r.get("news") or [], get_macro_data()
@@ -0,0 +1,37 @@
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------------------------------------------------------
+# 소스별 타임아웃 (초)
+# ---------------------------------------------------------
+DEFAULT_TIMEOUT = 8
+SOURCE_TIMEOUTS = {
+    "history": 8,
+    "info": 6,
+    "calendar": 5,
+    "holders": 5,
+    "news": 4,
+}
+
+# 프로세스 전역 워커 풀 (세션 간 공유)
+_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pause-fetch")
+
+
+def gather(jobs, timeouts=None):
+    # 모든 job을 동시에 실행하고 name -> 결과 dict 반환.
+    # 타임아웃/예외가 난 소스는 None 으로 채우고 errors 에 기록 (부분 결과 허용).
+    timeouts = SOURCE_TIMEOUTS if timeouts is None else timeouts
+    start = time.monotonic()
+    # 호출자의 컨텍스트(스케줄러 우선순위 등)를 워커 스레드로 전달
+    futures = {name: _pool.submit(contextvars.copy_context().run, fn) for name, fn in jobs.items()}
+    results, errors = {}, {}
+    for name, fut in futures.items():
+        remaining = start + timeouts.get(name, DEFAULT_TIMEOUT) - time.monotonic()
+        try:
+            results[name] = fut.result(timeout=max(remaining, 0))
+        except Exception as e:
+            results[name] = None
+            errors[name] = e
+    results["_errors"] = errors
+    return results
@@ -0,0 +1,243 @@
+import argparse
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+import numpy as np
+
+# ---------------------------------------------------------
+# 펀더멘털/실적일 스냅샷 (유니버스 전체를 미리 계산한 컬럼형 테이블)
+# info / calendar / institutional_holders 는 가장 느린 yfinance 호출이고 하루에 한 번 이상 바뀌지 않으므로
+# 야간(cron) 또는 필요 시 일괄 작업으로 구축하고, 분석 경로는 메모리 인덱스에서 조회.
+#   python -m pause.fundamentals build universe.txt [--workers 8]
+#   python -m pause.fundamentals show AAPL
+# PAUSE_FUNDAMENTALS = 테이블 경로, PAUSE_UNIVERSE = 기본 유니버스 파일
+# ---------------------------------------------------------
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pause", "fundamentals.npy")
+MAX_AGE = 36 * 3600  # 이보다 오래된 행은 무시하고 실시간 조회
+RELOAD_CHECK = 30  # 파일 변경 여부 확인 간격 (초)
+EARNINGS_WARN_DAYS = 5
+TOP_HOLDERS = 3
+WORKERS = 8
+
+DTYPE = np.dtype([
+    ("ticker", "U12"),
+    ("name", "U64"),
+    ("market_cap", "<f8"),
+    ("trailing_pe", "<f8"),
+    ("revenue_growth", "<f8"),
+    ("profit_margins", "<f8"),
+    ("earnings", "<M8[D]"),  # 다음 실적일 (없으면 NaT)
+    ("holders", "U64", (TOP_HOLDERS,)),
+    ("updated", "<f8"),
+])
+FUND_FIELDS = ("market_cap", "trailing_pe", "revenue_growth", "profit_margins")
+
+
+# ---------------------------------------------------------
+# yfinance 원본 -> 분석 입력 (실시간 조회와 스냅샷 구축이 같은 파서를 씀)
+# ---------------------------------------------------------
+def _earnings_date(cal):
+    if cal is None or not isinstance(cal, dict) or 'Earnings Date' not in cal: return None
+    e = cal['Earnings Date'][0]
+    if isinstance(e, datetime): return e.date()  # pandas Timestamp 포함
+    return e if isinstance(e, date) else None
+
+
+def _whales(inst):
+    if inst is None or inst.empty: return []
+    col = inst['Holder'] if 'Holder' in inst.columns else inst.iloc[:, 0]
+    return [str(h) for h in col.head(TOP_HOLDERS).tolist()]
+
+
+def parse_fundamentals(ticker, info, cal, inst):
+    # -> {"name", "fund", "earnings_date" (date|None), "whales"}
+    info = info or {}
+    try: e_date = _earnings_date(cal)
+    except Exception: e_date = None
+    try: whales = _whales(inst)
+    except Exception: whales = []
+    return {
+        "name": info.get('longName', ticker),
+        "fund": {
+            "market_cap": info.get('marketCap'),
+            "trailing_pe": info.get('trailingPE'),
+            "revenue_growth": info.get('revenueGrowth'),
+            "profit_margins": info.get('profitMargins'),
+        },
+        "earnings_date": e_date,
+        "whales": whales,
+    }
+
+
+def earnings_warning(e_date, today=None):
+    if e_date is None: return False
+    days_diff = (e_date - (today or datetime.now().date())).days
+    return 0 <= days_diff <= EARNINGS_WARN_DAYS
+
+
+def _num(v):
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        return np.nan
+    return v if math.isfinite(v) else np.nan
+
+
+def _fetch_row(ticker):
+    # 워커 스레드: 세 호출을 백그라운드 우선순위로 (사용자 분석이 먼저)
+    from pause.data import _fetch_calendar, _fetch_holders, _fetch_info
+    from pause.scheduler import BACKGROUND, scheduler
+    with scheduler.priority(BACKGROUND):
+        info = _fetch_info(ticker)
+        if not info: return None
+        try: cal = _fetch_calendar(ticker)
+        except Exception: cal = None
+        try: inst = _fetch_holders(ticker)
+        except Exception: inst = None
+    snap = parse_fundamentals(ticker, info, cal, inst)
+    row = np.zeros((), dtype=DTYPE)
+    row["ticker"] = ticker
+    row["name"] = str(snap["name"] or ticker)[:64]
+    for f in FUND_FIELDS: row[f] = _num(snap["fund"][f])
+    row["earnings"] = np.datetime64(snap["earnings_date"], "D") if snap["earnings_date"] else np.datetime64("NaT", "D")
+    row["holders"] = (snap["whales"] + [""] * TOP_HOLDERS)[:TOP_HOLDERS]
+    row["updated"] = time.time()
+    return row
+
+
+class FundamentalsTable:
+    def __init__(self, path=None, max_age=MAX_AGE):
+        self.path = path or os.environ.get("PAUSE_FUNDAMENTALS", DEFAULT_PATH)
+        self.max_age = max_age
+        # (배열, ticker -> 행 번호, ticker -> lookup 결과) 를 한 번에 교체 -> lookup 은 잠금 없이 한 번 읽음
+        self._state = (None, {}, {})
+        self._mtime = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def _maybe_reload(self):
+        # 조회마다 stat 하지 않고 RELOAD_CHECK 초마다 한 번만 파일 변경 확인
+        now = time.monotonic()
+        if now - self._checked < RELOAD_CHECK: return
+        with self._lock:
+            if now - self._checked < RELOAD_CHECK: return
+            self._checked = now
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                return
+            if mtime == self._mtime: return
+            try:
+                arr = np.load(self.path)
+            except (OSError, ValueError):
+                return
+            if arr.dtype != DTYPE: return
+            self._state = (arr, {t: i for i, t in enumerate(arr["ticker"].tolist())}, {})
+            self._mtime = mtime
+
+    def load(self):
+        # 저장된 전체 테이블 (없으면 빈 배열)
+        self._checked = 0.0
+        self._maybe_reload()
+        arr = self._state[0]
+        return np.zeros(0, dtype=DTYPE) if arr is None else arr
+
+    def lookup(self, ticker):
+        # -> parse_fundamentals 와 같은 dict (+ "updated", 읽기 전용), 없거나 max_age 보다 오래됐으면 None
+        self._maybe_reload()
+        ticker = ticker.strip().upper()
+        arr, index, decoded = self._state
+        snap = decoded.get(ticker)
+        if snap is None:
+            i = index.get(ticker)
+            if i is None: return None
+            snap = decoded[ticker] = self._decode(arr[i])
+        return None if snap["updated"] + self.max_age <= time.time() else snap
+
+    def _decode(self, r):
+        fund = {f: None if np.isnan(r[f]) else float(r[f]) for f in FUND_FIELDS}
+        return {
+            "name": str(r["name"]) or str(r["ticker"]),
+            "fund": fund,
+            "earnings_date": None if np.isnat(r["earnings"]) else r["earnings"].astype(object),
+            "whales": [h for h in r["holders"].tolist() if h],
+            "updated": float(r["updated"]),
+        }
+
+    def save(self, arr):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        arr = np.sort(arr, order="ticker")
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f: np.save(f, arr)
+        os.replace(tmp, self.path)
+        self._checked = 0.0
+
+    def build(self, tickers, workers=WORKERS, progress=None):
+        # 유니버스 전체를 워커 풀로 조회해 테이블 갱신. 실패한 종목은 기존 행 유지.
+        # -> (성공 수, 실패 종목 목록)
+        tickers = [t.strip().upper() for t in tickers if t.strip()]
+        old = self.load()
+        rows, failed = {}, []
+
+        def one(t):
+            try: return t, _fetch_row(t)
+            except Exception: return t, None
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pause-fund") as pool:
+            for n, (t, row) in enumerate(pool.map(one, tickers), 1):
+                if row is None: failed.append(t)
+                else: rows[t] = row
+                if progress: progress(n, len(tickers), t, row is not None)
+        keep = old[~np.isin(old["ticker"], list(rows))]
+        self.save(np.concatenate([keep, np.array(list(rows.values()), dtype=DTYPE).reshape(-1)]))
+        return len(rows), failed
+
+    def stats(self):
+        arr = self.load()
+        if not len(arr): return {"rows": 0}
+        return {"rows": len(arr), "oldest": float(arr["updated"].min()), "newest": float(arr["updated"].max()), "bytes": arr.nbytes}
+
+
+# 프로세스 전역 테이블 (파일이 바뀌면 다음 조회 때 다시 읽음)
+fundamentals_table = FundamentalsTable()
+
+
+def main(argv=None):
+    from pause.screener import parse_watchlist
+    p = argparse.ArgumentParser(description="PAUSE fundamentals/earnings snapshot")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="fetch info/calendar/holders for a universe and rewrite the table")
+    b.add_argument("universe", nargs="?", default=os.environ.get("PAUSE_UNIVERSE"),
+                   help="file with tickers (comma/space/newline separated), or '-' for stdin (default: $PAUSE_UNIVERSE)")
+    b.add_argument("--workers", type=int, default=WORKERS)
+    s = sub.add_parser("show", help="print stored rows")
+    s.add_argument("tickers", nargs="*")
+    args = p.parse_args(argv)
+
+    if args.cmd == "build":
+        if not args.universe: p.error("universe file required (or set PAUSE_UNIVERSE)")
+        text = sys.stdin.read() if args.universe == "-" else open(args.universe).read()
+        tickers = parse_watchlist(text)
+        start = time.time()
+        ok, failed = fundamentals_table.build(tickers, args.workers,
+                                              lambda n, total, t, good: print(f"[{n}/{total}] {t}{'' if good else ' FAILED'}", file=sys.stderr))
+        print(f"built {ok}/{len(tickers)} in {time.time() - start:.1f}s -> {fundamentals_table.path}", file=sys.stderr)
+        if failed: print("failed: " + " ".join(failed), file=sys.stderr)
+        return
+
+    arr = fundamentals_table.load()
+    want = {t.upper() for t in args.tickers}
+    for r in arr:
+        if want and r["ticker"] not in want: continue
+        print(r["ticker"], r["name"], *(f"{f}={r[f]:.4g}" for f in FUND_FIELDS), f"earnings={r['earnings']}",
+              "holders=" + "|".join(h for h in r["holders"].tolist() if h),
+              f"age={(time.time() - r['updated']) / 3600:.1f}h")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------------------------
+# 기술적 지표
+# Series(단일 종목) 또는 (날짜 × 종목) DataFrame 패널 모두에 동작.
+# 패널이면 pandas rolling/ewm 이 모든 종목 컬럼을 한 번에 계산함.
+# ---------------------------------------------------------
+PANEL_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+EMA_SPAN = 5
+STOCH_WINDOW = 14
+RSI_WINDOW = 14
+BB_WINDOW = 20
+BB_K = 2
+VOL_WINDOW = 20
+
+
+def ema(close, span=EMA_SPAN):
+    # 빠진 봉(NaN)은 건너뛰고 종목 자신의 봉만으로 재귀 (ignore_na)
+    return close.ewm(span=span, adjust=False, ignore_na=True).mean()
+
+def stochastic_k(df, window=STOCH_WINDOW):
+    low = df['Low'].rolling(window).min()
+    high = df['High'].rolling(window).max()
+    return 100 * ((df['Close'] - low) / (high - low))
+
+def volume_ratio(volume, window=VOL_WINDOW):
+    return (volume / volume.rolling(window).mean()) * 100
+
+def rsi(close, window=RSI_WINDOW):
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+def bollinger(close, window=BB_WINDOW, k=BB_K):
+    sma = close.rolling(window).mean()
+    std = close.rolling(window).std()
+    return sma - (k * std), sma + (k * std)
+
+
+# ---------------------------------------------------------
+# 다종목 패널
+# ---------------------------------------------------------
+def make_panel(hists):
+    # {ticker: OHLCV DataFrame} -> {field: (날짜 × 종목) DataFrame}
+    tickers = list(hists)
+    return {f: pd.DataFrame({t: hists[t][f] for t in tickers}, columns=tickers).sort_index() for f in PANEL_FIELDS}
+
+def compute_panel(panel):
+    # 전체 기간 지표 시계열 (차트용) -> {name: (날짜 × 종목) DataFrame}
+    close = panel['Close']
+    bbl, bbu = bollinger(close)
+    return {
+        "ema5": ema(close),
+        "stoch_k": stochastic_k(panel),
+        "rsi": rsi(close),
+        "bb_lower": bbl,
+        "bb_upper": bbu,
+        "vol_ratio": volume_ratio(panel['Volume']),
+    }
+
+
+class IndicatorState:
+    # 종목별 최근 봉 링버퍼 + EMA 값.
+    # update() 는 새 봉 하나를 반영하며 비용이 히스토리 길이와 무관 (EMA O(1), 나머지는 창 크기만큼).
+    # 결과는 위 pandas 정의(rolling, ddof=1 std, adjust=False ewm)를 종목별로 따로 계산한 값과 같음.
+    # 패널은 종목들의 합집합 날짜로 정렬되므로, 어떤 종목에 없는 봉(거래정지, 다른 거래소 달력)은
+    # 그 종목의 창에 넣지 않음 -> 링버퍼 위치도 종목별.
+    WINDOW = max(STOCH_WINDOW, RSI_WINDOW + 1, BB_WINDOW, VOL_WINDOW)
+
+    def __init__(self, tickers):
+        self.tickers = list(tickers)
+        n = len(self.tickers)
+        self.ema5 = np.full(n, np.nan)
+        self._alpha = 2.0 / (EMA_SPAN + 1)
+        self._buf = {f: np.full((self.WINDOW, n), np.nan) for f in PANEL_FIELDS}
+        self._pos = np.zeros(n, dtype=int)  # 종목별 다음에 쓸 링버퍼 행
+        self.bars = 0
+
+    @classmethod
+    def from_panel(cls, panel):
+        # 패널 전체로 초기화: EMA 는 전체 기간 재귀 결과, 나머지는 종목별 마지막 WINDOW 봉만 보관
+        close = panel['Close']
+        st = cls(close.columns)
+        st.ema5 = ema(close).ffill().iloc[-1].to_numpy(dtype=float) if len(close) else st.ema5
+        # 종가가 있는 봉만 종목별로 뒤에서부터 세어 마지막 WINDOW 개를 버퍼 끝에 정렬
+        valid = close.notna().to_numpy()
+        rank = valid[::-1].cumsum(axis=0)[::-1]  # 그 봉 포함, 뒤쪽 유효 봉 수
+        rows, cols = np.nonzero(valid & (rank <= cls.WINDOW))
+        for f in PANEL_FIELDS:
+            st._buf[f][cls.WINDOW - rank[rows, cols], cols] = panel[f].to_numpy(dtype=float)[rows, cols]
+        st.bars = len(close)
+        return st
+
+    @classmethod
+    def from_frame(cls, df, ticker="_"):
+        return cls.from_panel(make_panel({ticker: df}))
+
+    def _as_array(self, values):
+        if isinstance(values, pd.Series): values = values.reindex(self.tickers)
+        return np.asarray(values, dtype=float).reshape(len(self.tickers))
+
+    def update(self, bar):
+        # bar: {field: 종목 순서 배열 또는 ticker 인덱스 Series}. 종가가 NaN 인 종목은 이 봉을 건너뜀.
+        close = self._as_array(bar['Close'])
+        cols = np.flatnonzero(~np.isnan(close))
+        for f in PANEL_FIELDS:
+            self._buf[f][self._pos[cols], cols] = self._as_array(bar[f])[cols]
+        prev = self.ema5
+        self.ema5 = np.where(np.isnan(prev), close, np.where(np.isnan(close), prev, self._alpha * close + (1 - self._alpha) * prev))
+        self._pos[cols] = (self._pos[cols] + 1) % self.WINDOW
+        self.bars += 1
+
+    def _last(self, field, n):
+        # 가장 오래된 것부터 최근 n 봉 (n, 종목)
+        rows = (self._pos + np.arange(self.WINDOW - n, self.WINDOW)[:, None]) % self.WINDOW
+        return self._buf[field][rows, np.arange(len(self.tickers))]
+
+    def snapshot(self):
+        # 마지막 봉 기준 지표 값 -> {name: 종목 순서 배열}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            close = self._last('Close', BB_WINDOW)
+            price = close[-1]
+            low = self._last('Low', STOCH_WINDOW).min(axis=0)
+            high = self._last('High', STOCH_WINDOW).max(axis=0)
+            delta = np.diff(self._last('Close', RSI_WINDOW + 1), axis=0)
+            gain = np.where(delta > 0, delta, 0.0).mean(axis=0)
+            loss = np.where(delta < 0, -delta, 0.0).mean(axis=0)
+            gain[np.isnan(delta).any(axis=0)] = np.nan
+            sma = close.mean(axis=0)
+            std = close.std(axis=0, ddof=1)
+            vol = self._last('Volume', VOL_WINDOW)
+            return {
+                "price": price,
+                "ema5": self.ema5,
+                "stoch_k": 100 * ((price - low) / (high - low)),
+                "rsi": 100 - (100 / (1 + gain / loss)),
+                "bb_lower": sma - BB_K * std,
+                "bb_upper": sma + BB_K * std,
+                "vol_ratio": vol[-1] / vol.mean(axis=0) * 100,
+                "is_green": price > self._last('Open', 1)[-1],
+            }
+
+    def rows(self):
+        # {ticker: short_term_snapshot + swing_snapshot 키}
+        snap = self.snapshot()
+        out = {}
+        for i, t in enumerate(self.tickers):
+            r = {k: float(v[i]) for k, v in snap.items() if k != "is_green"}
+            r["trend"] = "BULLISH" if r["price"] > r["ema5"] else "BEARISH"
+            r["is_green"] = bool(snap["is_green"][i])
+            out[t] = r
+        return out
+
+
+def short_term_snapshot(df):
+    # 단타 탭 지표의 마지막 값
+    r = IndicatorState.from_frame(df).rows()["_"]
+    return {k: r[k] for k in ("ema5", "trend", "stoch_k", "vol_ratio", "is_green")}
+
+def swing_snapshot(df):
+    # 스윙 탭 지표의 마지막 값
+    r = IndicatorState.from_frame(df).rows()["_"]
+    return {k: r[k] for k in ("rsi", "bb_lower", "bb_upper", "vol_ratio")}
@@ -0,0 +1,155 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+
+from pause.scheduler import scheduler
+
+MODEL = "gpt-4o"
+
+def _messages(sys_msg, user_msg):
+    return [{"role": "system", "content": sys_msg}, {"role": "user", "content": user_msg}]
+
+def chat_json(client, sys_msg, user_msg, model=MODEL):
+    res = scheduler.call("openai", client.chat.completions.create, model=model, messages=_messages(sys_msg, user_msg), response_format={"type": "json_object"})
+    return json.loads(res.choices[0].message.content)
+
+# ---------------------------------------------------------
+# 스트리밍 (부분 JSON 점진 파싱)
+# ---------------------------------------------------------
+def _closers(text):
+    # 미완성 JSON 을 닫는 데 필요한 문자열 (열린 문자열/배열/객체 순서대로)
+    stack, in_str, esc = [], False, False
+    for ch in text:
+        if in_str:
+            if esc: esc = False
+            elif ch == "\\": esc = True
+            elif ch == '"': in_str = False
+        elif ch == '"': in_str = True
+        elif ch in "{[": stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack: stack.pop()
+    if esc: return None  # 이스케이프 도중에 끊김
+    return ('"' if in_str else "") + "".join(reversed(stack))
+
+def parse_partial_json(text):
+    # 스트림 도중의 JSON 조각 -> 지금까지 완성된 부분의 dict (파싱 불가면 None).
+    # 끝에서부터 한 글자씩 잘라가며 닫을 수 있는 가장 긴 접두사를 찾음.
+    start = text.find("{")
+    if start < 0: return None
+    text = text[start:]
+    closers = _closers(text)
+    if closers is not None and not closers.startswith('"'):
+        # 끝의 숫자/리터럴은 아직 이어질 수 있으므로 (12 -> 123.4) 완성될 때까지 보류
+        text = re.sub(r"[-+.\w]+$", "", text)
+    for end in range(len(text), 0, -1):
+        head = text[:end]
+        closers = _closers(head)
+        if closers is None: continue
+        try:
+            value = json.loads(head + closers)
+        except ValueError:
+            continue
+        return value if isinstance(value, dict) else None
+    return None
+
+def chat_json_stream(client, sys_msg, user_msg, model=MODEL):
+    # 토큰이 도착할 때마다 지금까지의 부분 dict 를 yield, 마지막은 전체 응답
+    stream = scheduler.call("openai", client.chat.completions.create, model=model, messages=_messages(sys_msg, user_msg), response_format={"type": "json_object"}, stream=True)
+    buf, last = "", None
+    for chunk in stream:
+        if not chunk.choices: continue
+        delta = chunk.choices[0].delta.content
+        if not delta: continue
+        buf += delta
+        partial = parse_partial_json(buf)
+        if partial is not None and partial != last:
+            last = partial
+            yield partial
+    yield json.loads(buf)
+
+# ---------------------------------------------------------
+# 다종목 일괄 요청
+# ---------------------------------------------------------
+BATCH_SIZE = 10
+BATCH_RETRIES = 2
+OUTPUT_TOKENS_PER_TICKER = 80
+DEFAULT_TPM = 30000
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+class TokenBudget:
+    # 최근 60초 사용 토큰이 tokens_per_minute 를 넘지 않도록 대기
+    def __init__(self, tokens_per_minute=DEFAULT_TPM):
+        self.tpm = tokens_per_minute
+        self._spent = deque()  # [time, tokens] (adjust 가 추정치를 실제 사용량으로 고침)
+        self._lock = threading.Lock()
+
+    def _used(self, now):
+        while self._spent and self._spent[0][0] <= now - 60: self._spent.popleft()
+        return sum(n for _, n in self._spent)
+
+    def wait(self, tokens):
+        # 예산이 날 때까지 대기 후 기록 -> 기록 항목 (adjust 에 넘김)
+        tokens = min(tokens, self.tpm)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._used(now) + tokens <= self.tpm:
+                    entry = [now, tokens]
+                    self._spent.append(entry)
+                    return entry
+                delay = self._spent[0][0] + 60 - now
+            time.sleep(max(delay, 0.05))
+
+    def adjust(self, entry, tokens):
+        # wait() 가 기록한 추정치를 실제 사용량으로 교체 (같은 60초 창에서 함께 만료되도록 원래 항목을 고침)
+        with self._lock: entry[1] = tokens
+
+def _split_batch(data, requested):
+    # 응답 검증 후 {ticker: entry}. 누락/형식 오류 종목은 빠짐 (재시도 대상)
+    out = {}
+    results = data.get("results") if isinstance(data, dict) else None
+    for e in results if isinstance(results, list) else []:
+        if not isinstance(e, dict): continue
+        t = str(e.get("ticker", "")).strip().upper()
+        if t not in requested or t in out or e.get("verdict") not in ("GO", "WAIT"): continue
+        try:
+            stop_loss, target = float(e["stop_loss"]), float(e["target"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        reasoning = e.get("reasoning")
+        out[t] = {"verdict": e["verdict"], "stop_loss": stop_loss, "target": target,
+                  "reasoning": reasoning if isinstance(reasoning, list) else ([reasoning] if reasoning else [])}
+    return out
+
+def chat_json_batch(client, sys_msg, summaries, make_user_msg, batch_size=BATCH_SIZE, budget=None, limiter=None, retries=BATCH_RETRIES, model=MODEL):
+    # summaries: {ticker: 한 줄 요약}. batch_size 개씩 한 요청으로 묶고, 실패한 종목만 다시 요청.
+    # -> {ticker: {verdict, stop_loss, target, reasoning}} (재시도 후에도 실패한 종목은 없음)
+    results, pending = {}, list(summaries)
+    for _ in range(retries + 1):
+        failed = []
+        for i in range(0, len(pending), batch_size):
+            chunk = pending[i:i + batch_size]
+            user_msg = make_user_msg([summaries[t] for t in chunk])
+            estimate = estimate_tokens(sys_msg + user_msg) + OUTPUT_TOKENS_PER_TICKER * len(chunk)
+            spent = budget.wait(estimate) if budget else None
+            if limiter: limiter.wait()
+            try:
+                res = scheduler.call("openai", client.chat.completions.create, model=model, messages=_messages(sys_msg, user_msg), response_format={"type": "json_object"})
+                data = json.loads(res.choices[0].message.content)
+            except Exception:
+                failed += chunk
+                continue
+            usage = getattr(getattr(res, "usage", None), "total_tokens", None)
+            if spent and usage: budget.adjust(spent, usage)
+            got = _split_batch(data, set(chunk))
+            results.update(got)
+            failed += [t for t in chunk if t not in got]
+        pending = failed
+        if not pending: break
+    return results
+
+# 프로세스 전역 토큰 예산 (OpenAI TPM 한도)
+token_budget = TokenBudget()
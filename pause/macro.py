@@ -0,0 +1,83 @@
+import threading
+import time
+
+# ---------------------------------------------------------
+# 매크로 스냅샷 (SPY / VIX / 10Y) 백그라운드 갱신
+# 서버 프로세스당 스레드 하나가 주기적으로 갱신, 요청 경로는 마지막 값만 읽음.
+# ---------------------------------------------------------
+MACRO_TICKERS = ["SPY", "^VIX", "^TNX"]
+REFRESH_INTERVAL = 60
+STALE_AFTER = 5 * 60  # 이 시간 이상 갱신 실패 시 UI 에 stale 표시
+
+
+def fetch_macro():
+    import yfinance as yf
+    from pause.scheduler import scheduler
+    data = scheduler.call("yahoo", yf.download, MACRO_TICKERS, period="5d", progress=False)['Close']
+    if data.empty: return None
+    last_row = data.iloc[-1]
+    try:
+        spy_price = float(last_row['SPY'])
+        vix = float(last_row['^VIX'])
+        tnx = float(last_row.get('^TNX', 0))
+    except:
+        spy_price = float(last_row.get('SPY', 0))
+        vix = float(last_row.get('^VIX', 0))
+        tnx = float(last_row.get('^TNX', 0))
+    return {"spy_price": spy_price, "vix": vix, "tnx": tnx}
+
+
+class MacroRefresher:
+    def __init__(self, fetch=fetch_macro, interval=REFRESH_INTERVAL):
+        self.fetch = fetch
+        self.interval = interval
+        self._snapshot = None
+        self._updated_at = None  # 마지막 성공 시각 (time.time)
+        self._last_error = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        # 여러 번 호출해도 스레드는 하나
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive(): return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pause-macro", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        from pause.metrics import metrics
+        from pause.scheduler import BACKGROUND, scheduler
+        try:
+            with metrics.timed("macro.refresh"), scheduler.priority(BACKGROUND): snap = self.fetch()
+        except Exception as e:
+            self._last_error = e
+            return
+        if snap is None: return
+        self._snapshot, self._updated_at, self._last_error = snap, time.time(), None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+
+    def read(self):
+        # 논블로킹: 마지막 스냅샷 (아직 없으면 None)
+        return self._snapshot
+
+    def status(self):
+        age = None if self._updated_at is None else time.time() - self._updated_at
+        return {
+            "updated_at": self._updated_at,
+            "age": age,
+            "stale": age is None or age > STALE_AFTER,
+            "error": None if self._last_error is None else str(self._last_error),
+        }
+
+
+# 프로세스 전역 갱신기
+macro_refresher = MacroRefresher()
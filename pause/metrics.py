@@ -0,0 +1,182 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# ---------------------------------------------------------
+# 핫패스 계측 (단계별 지연/성공 여부/캐시 상태, 최근 N 건 p50/p95)
+# PAUSE_METRICS_LOG=경로 -> 기록마다 JSON 한 줄 append
+# PAUSE_METRICS_PORT=포트 -> /metrics 에 Prometheus 텍스트 노출
+# ---------------------------------------------------------
+WINDOW = 500  # 단계별 보관 샘플 수
+
+
+def _pct(sorted_vals, q):
+    if not sorted_vals: return None
+    return sorted_vals[min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))]
+
+
+class _Timer:
+    def __init__(self, registry, stage):
+        self.registry = registry
+        self.stage = stage
+        self.cache = None  # "hit" / "miss" / "shared" (캐시를 거치는 단계만)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.record(self.stage, time.perf_counter() - self.start, ok=exc_type is None,
+                             cache=self.cache, error=None if exc is None else type(exc).__name__)
+        return False
+
+
+class Metrics:
+    def __init__(self, window=WINDOW, log_path=None):
+        self.window = window
+        self.log_path = log_path
+        self._stages = {}
+        self._gauges = {}  # (name, labels) -> 현재 값 (대기열 길이 등)
+        self._lock = threading.Lock()
+
+    def _stage(self, stage):
+        s = self._stages.get(stage)
+        if s is None:
+            s = self._stages[stage] = {"samples": deque(maxlen=self.window), "count": 0, "errors": 0,
+                                       "total": 0.0, "cache": {}, "last_error": None}
+        return s
+
+    def record(self, stage, seconds, ok=True, cache=None, error=None):
+        with self._lock:
+            s = self._stage(stage)
+            s["samples"].append(seconds)
+            s["count"] += 1
+            s["total"] += seconds
+            if not ok:
+                s["errors"] += 1
+                s["last_error"] = error
+            if cache: s["cache"][cache] = s["cache"].get(cache, 0) + 1
+        if self.log_path:
+            line = json.dumps({"ts": time.time(), "stage": stage, "seconds": round(seconds, 6), "ok": ok, "cache": cache, "error": error})
+            try:
+                with open(self.log_path, "a") as f: f.write(line + "\n")
+            except OSError:
+                pass
+
+    def gauge(self, name, value, **labels):
+        with self._lock: self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def gauges(self):
+        with self._lock:
+            return [{"name": name, **dict(labels), "value": v} for (name, labels), v in sorted(self._gauges.items())]
+
+    def timed(self, stage):
+        # with metrics.timed("yf.info"): ...   (예외는 실패로 기록 후 그대로 전파)
+        return _Timer(self, stage)
+
+    def cached(self, stage, cache, kind, key, fetch):
+        # cache.get_or_fetch 래퍼: 실제 조회는 "<stage>.fetch", 전체 조회는 stage 에 hit/miss 와 함께 기록
+        fetched = []
+        def run():
+            fetched.append(True)
+            with self.timed(stage + ".fetch"): return fetch()
+        with self.timed(stage) as t:
+            try:
+                return cache.get_or_fetch(kind, key, run)
+            finally:
+                t.cache = "miss" if fetched else "hit"
+
+    def snapshot(self):
+        with self._lock:
+            out = {}
+            for stage, s in sorted(self._stages.items()):
+                vals = sorted(s["samples"])
+                out[stage] = {
+                    "count": s["count"],
+                    "errors": s["errors"],
+                    "p50_ms": None if not vals else round(_pct(vals, 0.5) * 1000, 1),
+                    "p95_ms": None if not vals else round(_pct(vals, 0.95) * 1000, 1),
+                    "max_ms": None if not vals else round(vals[-1] * 1000, 1),
+                    "hits": s["cache"].get("hit", 0),
+                    "misses": s["cache"].get("miss", 0),
+                    "last_error": s["last_error"],
+                }
+            return out
+
+    def prometheus(self):
+        lines = [
+            "# TYPE pause_stage_seconds summary",
+            "# TYPE pause_stage_errors_total counter",
+            "# TYPE pause_stage_cache_total counter",
+        ]
+        with self._lock:
+            for stage, s in sorted(self._stages.items()):
+                vals = sorted(s["samples"])
+                for q in (0.5, 0.95):
+                    if vals: lines.append(f'pause_stage_seconds{{stage="{stage}",quantile="{q}"}} {_pct(vals, q):.6f}')
+                lines.append(f'pause_stage_seconds_sum{{stage="{stage}"}} {s["total"]:.6f}')
+                lines.append(f'pause_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+                lines.append(f'pause_stage_errors_total{{stage="{stage}"}} {s["errors"]}')
+                for status, n in sorted(s["cache"].items()):
+                    lines.append(f'pause_stage_cache_total{{stage="{stage}",status="{status}"}} {n}')
+            for name in sorted({name for name, _ in self._gauges}): lines.append(f"# TYPE pause_{name} gauge")
+            for (name, labels), v in sorted(self._gauges.items()):
+                label_str = ",".join(f'{k}="{val}"' for k, val in labels)
+                lines.append(f"pause_{name}{{{label_str}}} {v}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._gauges.clear()
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port, registry=None):
+    # 백그라운드 HTTP 서버로 /metrics 노출 (프로세스당 한 번)
+    global _server
+    registry = registry or metrics
+    with _server_lock:
+        if _server is not None: return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] == "/metrics":
+                    body, ctype = registry.prometheus().encode(), "text/plain; version=0.0.4"
+                elif self.path.split("?")[0] == "/metrics.json":
+                    body, ctype = json.dumps(registry.snapshot()).encode(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        _server = ThreadingHTTPServer(("0.0.0.0", int(port)), Handler)
+        threading.Thread(target=_server.serve_forever, name="pause-metrics", daemon=True).start()
+        return _server
+
+
+def serve_from_env(registry=None):
+    # PAUSE_METRICS_PORT 가 있으면 serve(), 포트 사용 중이면 조용히 생략
+    port = os.environ.get("PAUSE_METRICS_PORT")
+    if not port: return None
+    try:
+        return serve(port, registry)
+    except OSError:
+        return None
+
+
+# 프로세스 전역 레지스트리
+metrics = Metrics(log_path=os.environ.get("PAUSE_METRICS_LOG"))
@@ -0,0 +1,205 @@
+import hashlib
+import io
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+
+from pause.clients import http_session
+from pause.metrics import metrics
+from pause.scheduler import BACKGROUND, scheduler
+from pause.shared_cache import shared_cache
+
+# ---------------------------------------------------------
+# 뉴스 수집 (Google News RSS)
+# 추적 중인 종목을 백그라운드에서 조건부 요청(ETag / If-Modified-Since)으로 폴링,
+# iterparse 로 스트리밍 파싱하며 이미 본 기사는 건너뛰고, 제목 기준 중복 제거 후
+# 종목별 고정 크기 링버퍼에 보관. 분석 경로는 메모리에서 바로 읽음.
+# TRACK_FOR 동안 조회/폴링이 없던 종목의 버퍼는 삭제.
+# 공유 캐시가 있으면 폴링 주기마다 한 워커만 RSS 를 받고, 나머지는 그 헤드라인을 병합.
+# ---------------------------------------------------------
+FEED_URL = "https://news.google.com/rss/search?q={ticker}+stock+finance&hl=en-US&gl=US&ceid=US:en"
+PER_TICKER = 20  # 종목별 보관 헤드라인 수
+MAX_HEADLINES = 5000  # 전체 헤드라인 intern 테이블 크기
+POLL_INTERVAL = 120
+TRACK_FOR = 30 * 60  # 마지막 조회 후 이 시간이 지나면 폴링 중단
+FETCH_TIMEOUT = 3
+
+
+def headline_key(title):
+    # "Apple shares rise - Reuters" / "Apple Shares Rise | Yahoo" -> 같은 키
+    t = re.split(r"\s+[-|–]\s+[^-|–]+$", title or "")[0]
+    return hashlib.sha1(re.sub(r"[^a-z0-9]+", " ", t.lower()).strip().encode()).hexdigest()[:16]
+
+
+class _Feed:
+    __slots__ = ("items", "keys", "etag", "modified", "last_read", "last_poll")
+
+    def __init__(self):
+        self.items = deque(maxlen=PER_TICKER)  # 최신이 왼쪽, 각 원소는 공유 headline dict
+        self.keys = set()
+        self.etag = None
+        self.modified = None
+        self.last_read = 0.0
+        self.last_poll = 0.0
+
+
+class NewsService:
+    def __init__(self, session=None, interval=POLL_INTERVAL, shared=None):
+        self._session = session
+        self.shared = shared
+        self.interval = interval
+        self._feeds = {}
+        self._headlines = OrderedDict()  # key -> {'title', 'url'} (종목 간 공유)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def session(self):
+        return self._session or http_session()
+
+    def _intern(self, key, title, url):
+        h = self._headlines.get(key)
+        if h is None:
+            h = self._headlines[key] = {'title': title, 'url': url}
+            while len(self._headlines) > MAX_HEADLINES: self._headlines.popitem(last=False)
+        else:
+            self._headlines.move_to_end(key)
+        return h
+
+    def _parse(self, stream, feed):
+        # 새 항목만 (문서 순서) 반환. 검색 피드는 시간순이 보장되지 않으므로 이미 가진 기사는 건너뛰고 끝까지 읽음.
+        new = []
+        for _, el in ET.iterparse(stream, events=("end",)):
+            if el.tag != "item": continue
+            title = el.findtext("title") or "No Title"
+            link = el.findtext("link") or "#"
+            el.clear()
+            key = headline_key(title)
+            if key in feed.keys or any(key == k for k, _, _ in new): continue
+            new.append((key, title, link))
+        return new
+
+    def _add(self, feed, new):
+        # new: 최신순 (key, title, url). self._lock 안에서 호출
+        for key, title, link in reversed(new):
+            if len(feed.items) == feed.items.maxlen:
+                feed.keys.discard(headline_key(feed.items[-1]['title']))
+            feed.items.appendleft(self._intern(key, title, link))
+            feed.keys.add(key)
+
+    def poll(self, ticker):
+        ticker = ticker.strip().upper()
+        if self.shared is None: return self._poll(ticker)
+        added = []
+        def run():
+            added.append(self._poll(ticker))
+            with self._lock: return [(h['title'], h['url']) for h in self._feeds[ticker].items]
+        items = self.shared.get_or_fetch("news", ticker, run, self.interval)
+        if added: return added[0]
+        # 다른 워커가 받은 헤드라인 중 처음 보는 것만 추가
+        with self._lock:
+            feed = self._feeds.setdefault(ticker, _Feed())
+            feed.last_poll = time.time()
+            new = [(k, t, u) for k, t, u in ((headline_key(t), t, u) for t, u in items or []) if k not in feed.keys]
+            self._add(feed, new)
+        return len(new)
+
+    def _get(self, url, headers):
+        # 429 는 스케줄러 안에서 예외로 -> 제공자 백오프 (Retry-After 반영)
+        resp = self.session.get(url, headers=headers, timeout=FETCH_TIMEOUT, stream=True)
+        if resp.status_code == 429:
+            close = getattr(resp, "close", None)
+            if close: close()
+            resp.raise_for_status()
+        return resp
+
+    def _poll(self, ticker):
+        with self._lock:
+            feed = self._feeds.setdefault(ticker, _Feed())
+        headers = {}
+        if feed.etag: headers["If-None-Match"] = feed.etag
+        if feed.modified: headers["If-Modified-Since"] = feed.modified
+        # 실패(DNS, 연결 거부, Throttled)도 시도 시각으로 기록 -> 다음 시도는 interval 뒤
+        feed.last_poll = time.time()
+        with metrics.timed("news.rss") as m:
+            resp = scheduler.call("news", self._get, FEED_URL.format(ticker=ticker), headers)
+            try:
+                if resp.status_code == 304:
+                    m.cache = "hit"
+                    return 0
+                m.cache = "miss"
+                resp.raise_for_status()
+                raw = getattr(resp, "raw", None)
+                if raw is not None and hasattr(raw, "decode_content"): raw.decode_content = True
+                new = self._parse(raw if raw is not None else io.BytesIO(resp.content), feed)
+            finally:
+                close = getattr(resp, "close", None)
+                if close: close()
+        with self._lock:
+            feed.etag = resp.headers.get("ETag") or feed.etag
+            feed.modified = resp.headers.get("Last-Modified") or feed.modified
+            self._add(feed, new)
+        return len(new)
+
+    def get(self, ticker, limit=5):
+        # 분석 경로: 메모리에서 최신 limit 개. 처음 보는 종목만 한 번 동기 조회 후 추적 시작.
+        ticker = ticker.strip().upper()
+        with self._lock:
+            feed = self._feeds.get(ticker)
+            if feed is not None: feed.last_read = time.time()
+        if feed is None or not feed.last_poll:
+            try:
+                self.poll(ticker)
+            except Exception:
+                pass
+            with self._lock:
+                feed = self._feeds.setdefault(ticker, _Feed())
+                feed.last_read = time.time()
+        self.start()
+        with self._lock:
+            return [dict(h) for h in list(feed.items)[:limit]]
+
+    def tracked(self):
+        now = time.time()
+        with self._lock:
+            return [t for t, f in self._feeds.items() if now - f.last_read < TRACK_FOR]
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive(): return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pause-news", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        with scheduler.priority(BACKGROUND): self._loop()
+
+    def prune(self, now=None):
+        # TRACK_FOR 동안 읽지도 폴링하지도 않은 종목의 피드 삭제 -> 삭제한 수
+        now = time.time() if now is None else now
+        with self._lock:
+            old = [t for t, f in self._feeds.items() if now - max(f.last_read, f.last_poll) >= TRACK_FOR]
+            for t in old: del self._feeds[t]
+        return len(old)
+
+    def _loop(self):
+        while not self._stop.wait(1.0):
+            now = time.time()
+            self.prune(now)
+            for ticker in self.tracked():
+                feed = self._feeds.get(ticker)
+                if feed is None or now - feed.last_poll < self.interval: continue
+                try:
+                    self.poll(ticker)
+                except Exception:
+                    pass
+
+
+# 프로세스 전역 뉴스 서비스
+news_service = NewsService(shared=shared_cache)
@@ -0,0 +1,133 @@
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from pause.scheduler import scheduler
+
+# ---------------------------------------------------------
+# 로컬 OHLCV 저장소 (종목별 memory-mapped .npy)
+# 마지막 저장 봉 이후의 delta 만 받아 append, Yahoo 장애 시 디스크 데이터로 응답.
+# ---------------------------------------------------------
+DEFAULT_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "pause", "ohlcv")
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+DTYPE = np.dtype([("ts", "<i8")] + [(f, "<f8") for f in FIELDS])  # ts = UTC ns
+KEEP_DAYS = 2 * 365  # 이보다 오래된 봉은 저장 시 잘라냄
+
+
+def _yf_fetch(ticker, start=None, period="6mo"):
+    import yfinance as yf
+    t = yf.Ticker(ticker)
+    if start: return scheduler.call("yahoo", t.history, start=start)
+    return scheduler.call("yahoo", t.history, period=period)
+
+
+_PERIOD_UNITS = {"mo": "months", "y": "years", "d": "days"}
+
+
+def _period_cutoff(period, end):
+    # "6mo" / "1y" / "5d" -> end 기준 시작 시각
+    m = re.fullmatch(r"(\d+)(mo|y|d)", period)
+    return end - pd.DateOffset(**{_PERIOD_UNITS[m.group(2)]: int(m.group(1))})
+
+
+class OHLCVStore:
+    def __init__(self, root=None, fetch=None, keep_days=KEEP_DAYS):
+        self.root = root or os.environ.get("PAUSE_OHLCV_DIR", DEFAULT_ROOT)
+        self.fetch = fetch or _yf_fetch
+        self.keep_days = keep_days
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock(self, ticker):
+        with self._locks_lock:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _paths(self, ticker):
+        safe = ticker.upper().replace("/", "_").replace("^", "_IDX_")
+        return os.path.join(self.root, safe + ".npy"), os.path.join(self.root, safe + ".json")
+
+    def load(self, ticker):
+        # 저장된 전체 봉 -> DataFrame (없으면 None)
+        data_path, meta_path = self._paths(ticker)
+        try:
+            arr = np.load(data_path, mmap_mode="r")
+            with open(meta_path) as f: meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not len(arr): return None
+        idx = pd.to_datetime(np.asarray(arr["ts"]), unit="ns", utc=True).tz_convert(meta.get("tz") or "UTC")
+        return pd.DataFrame({f: np.asarray(arr[f]) for f in FIELDS}, index=idx)
+
+    def _covered(self, ticker):
+        # 전체 조회로 채운 구간의 시작 (meta "since", 없으면 None)
+        try:
+            with open(self._paths(ticker)[1]) as f: since = json.load(f).get("since")
+        except (OSError, ValueError):
+            return None
+        return None if since is None else pd.Timestamp(since)
+
+    def save(self, ticker, df, since=None):
+        os.makedirs(self.root, exist_ok=True)
+        idx = df.index if df.index.tz is not None else df.index.tz_localize("UTC")
+        cutoff = idx[-1] - pd.Timedelta(days=self.keep_days)
+        keep = idx >= cutoff
+        arr = np.empty(int(keep.sum()), dtype=DTYPE)
+        arr["ts"] = idx[keep].tz_convert("UTC").as_unit("ns").asi8
+        for f in FIELDS: arr[f] = df[f].to_numpy(dtype=float)[keep]
+        data_path, meta_path = self._paths(ticker)
+        # 임시 파일에 쓰고 교체 (읽는 쪽 mmap 이 깨지지 않도록, 이름은 프로세스/스레드별)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(data_path + suffix, "wb") as f: np.save(f, arr)
+        os.replace(data_path + suffix, data_path)
+        meta = {"tz": str(idx.tz), "fetched_at": time.time(), "since": None if since is None else since.isoformat()}
+        with open(meta_path + suffix, "w") as f: json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+
+    def _refresh(self, ticker, stored, covered, since):
+        # -> (병합 결과, 전체 조회로 채운 구간 시작)
+        # 저장분이 since 까지 거슬러 올라가지 않으면 since 부터 전체 조회
+        if stored is None or covered is None or since < covered:
+            new = self.fetch(ticker, start=since.strftime("%Y-%m-%d"))
+            return (None if new is None or new.empty else new), since
+        last = stored.index[-1]
+        new = self.fetch(ticker, start=last.strftime("%Y-%m-%d"))
+        if new is None or new.empty: return stored, covered
+        fresh = new[new.index > last]
+        # 배당/분할이 새로 생기면 과거 수정주가가 바뀌므로 저장 구간 전체 재조회
+        for col in ("Dividends", "Stock Splits"):
+            if col in fresh.columns and (fresh[col].fillna(0) != 0).any():
+                return self.fetch(ticker, start=covered.strftime("%Y-%m-%d")), covered
+        # 마지막 저장 봉(장중 부분 봉일 수 있음)은 새 값으로 교체
+        return pd.concat([stored[stored.index < new.index[0]], new[list(FIELDS)]]), covered
+
+    def history(self, ticker, period="6mo", cover=None):
+        # delta 만 받아 갱신 후 period 구간 반환. 조회 실패 시 저장된 데이터로 응답.
+        # cover: 반환은 period 만큼이지만 저장소는 이 기간까지 채워 둠 (차트 등 긴 구간용)
+        ticker = ticker.upper()
+        now = pd.Timestamp.now(tz="UTC")
+        since = min(_period_cutoff(p, now) for p in (period, cover or period))
+        since = max(since, now - pd.Timedelta(days=self.keep_days)).normalize()
+        with self._lock(ticker):
+            stored = self.load(ticker)
+            covered = self._covered(ticker) if stored is not None else None
+            try:
+                merged, covered = self._refresh(ticker, stored, covered, since)
+            except Exception:
+                merged = stored
+            else:
+                # 저장 실패(읽기 전용 홈, 디스크 부족)는 받은 데이터로 응답하고 다음 조회 때 다시 저장
+                if merged is not None and merged is not stored:
+                    try: self.save(ticker, merged, covered)
+                    except OSError: pass
+        if merged is None or merged.empty: return None
+        merged = merged[list(FIELDS)]
+        return merged[merged.index >= _period_cutoff(period, merged.index[-1])]
+
+
+# 프로세스 전역 저장소
+ohlcv_store = OHLCVStore()
@@ -0,0 +1,29 @@
+# ---------------------------------------------------------
+# LLM 프롬프트
+# ---------------------------------------------------------
+SHORT_SYS_MSG = "You are a High-Frequency Trader. Predict if stock will be GREEN TOMORROW. Output JSON: {verdict, entry_price, target_tomorrow, stop_loss, reasoning_list}. IMPORTANT: 'verdict' MUST be 'GO' or 'WAIT' (Do not use 'GREEN')."
+SWING_SYS_MSG = "You are a Swing Trader. Identify high-probability setups. Output JSON: {verdict, stop_loss, target, fund_analysis, tech_analysis, conclusion}. IMPORTANT: 'verdict' MUST be 'GO' or 'WAIT'."
+
+def short_user_msg(sym, price, ema5_val, trend_str, stoch_k, vol_ratio, is_green, macro_txt, news_text):
+    return f"Analyze {sym}. Price ${price}, EMA5 ${ema5_val} ({trend_str}), Stoch {stoch_k:.1f}, Vol {vol_ratio:.0f}%, Candle {'GREEN' if is_green else 'RED'}, {macro_txt}. News: {news_text[:500]}"
+
+def swing_user_msg(sym, risk, mk_cap, pe, whale_str, rsi_val, vol_ratio, macro_txt):
+    return f"Analyze {sym}. Risk {risk}. Cap ${mk_cap:.1f}B, P/E {pe}, Whales: {whale_str}. RSI {rsi_val:.1f}, Vol {vol_ratio:.0f}%. Market {macro_txt}. Decide GO/WAIT."
+
+def normalize_verdict(verdict):
+    verdict = verdict if isinstance(verdict, str) else 'WAIT'
+    if verdict not in ["GO", "WAIT"]: verdict = "GO" if "GO" in verdict else "WAIT"
+    return verdict
+
+# ---------------------------------------------------------
+# 다종목 일괄 판정 (한 요청에 N 종목)
+# ---------------------------------------------------------
+BATCH_SHORT_SYS_MSG = "You are a High-Frequency Trader. For EACH stock listed, predict if it will be GREEN TOMORROW. Output JSON: {results: [{ticker, verdict, stop_loss, target, reasoning}]} with exactly one entry per listed ticker. 'verdict' MUST be 'GO' or 'WAIT'. 'stop_loss' and 'target' are prices. 'reasoning' is a list of at most 2 short strings."
+
+def compact_summary(r):
+    # screener 행 -> 한 줄 요약 (토큰 절약)
+    return f"{r['ticker']} ${r['price']} EMA5 ${r['ema5']} {r['trend']} Stoch {r['stoch_k']:.0f} Vol {r['vol_ratio']:.0f}% {r['candle']}"
+
+def batch_user_msg(summaries, macro_txt):
+    lines = "\n".join(summaries)
+    return f"Market {macro_txt}. Stocks:\n{lines}"
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+from pause.metrics import metrics
+from pause.scheduler import BACKGROUND, scheduler
+from pause.shared_cache import shared_cache
+
+# ---------------------------------------------------------
+# 논블로킹 시세 서비스 ("Est. $" 필드용)
+# peek() 은 마지막으로 알려진 가격을 즉시 반환하고, 오래됐으면 백그라운드 갱신을 예약.
+# 같은 종목의 연속 요청은 debounce 창 안에서 fetch 한 번으로 합쳐짐.
+# 공유 캐시가 있으면 워커들 중 한 곳만 실제로 조회.
+# ---------------------------------------------------------
+QUOTE_TTL = 15
+DEBOUNCE = 0.3
+MAXSIZE = 512
+
+
+def _fetch_quote(ticker):
+    import yfinance as yf
+    t = yf.Ticker(ticker)
+    if hasattr(t, 'fast_info') and t.fast_info.last_price:
+        return t.fast_info.last_price
+    h = t.history(period='1d')
+    if not h.empty: return h['Close'].iloc[-1]
+    return None
+
+
+def fetch_quote(ticker):
+    return scheduler.call("yahoo", _fetch_quote, ticker)
+
+
+class QuoteService:
+    def __init__(self, fetch=fetch_quote, ttl=QUOTE_TTL, debounce=DEBOUNCE, maxsize=MAXSIZE, shared=None):
+        self.fetch = fetch
+        self.shared = shared
+        self.ttl = ttl
+        self.debounce = debounce
+        self.maxsize = maxsize
+        self._last = OrderedDict()  # ticker -> (price, fetched_at)
+        self._tried = {}  # ticker -> 마지막 시도 시각 (실패 시 ttl 동안 재시도 안 함)
+        self._pending = {}  # ticker -> Timer
+        self._lock = threading.Lock()
+
+    def peek(self, ticker, refresh=True):
+        # 마지막 가격 (없으면 None). refresh=False 면 갱신 예약 없이 읽기만.
+        if not ticker or len(ticker) < 2: return None
+        ticker = ticker.strip().upper()
+        now = time.time()
+        with self._lock:
+            last = self._last.get(ticker)
+            stale = last is None or now - last[1] > self.ttl
+            if refresh and stale and ticker not in self._pending and now - self._tried.get(ticker, 0) > self.ttl:
+                timer = self._pending[ticker] = threading.Timer(self.debounce, self._refresh, args=(ticker,))
+                timer.daemon = True
+                timer.start()
+        return None if last is None else last[0]
+
+    def _refresh(self, ticker):
+        price = None
+        try:
+            with metrics.timed("quote.fetch"), scheduler.priority(BACKGROUND):
+                if self.shared is None: price = self.fetch(ticker)
+                else: price = self.shared.get_or_fetch("quote", ticker, lambda: self.fetch(ticker), self.ttl)
+        except Exception:
+            pass
+        with self._lock:
+            self._pending.pop(ticker, None)
+            self._tried[ticker] = time.time()
+            if price:
+                self._last[ticker] = (float(price), time.time())
+                self._last.move_to_end(ticker)
+                while len(self._last) > self.maxsize: self._last.popitem(last=False)
+
+
+# 프로세스 전역 서비스
+quote_service = QuoteService(shared=shared_cache)
@@ -0,0 +1,223 @@
+import contextlib
+import contextvars
+import random
+import threading
+import time
+
+from pause.metrics import metrics
+
+# ---------------------------------------------------------
+# 외부 요청 스케줄러 (Yahoo / 뉴스 RSS / OpenAI)
+# 제공자별 토큰 버킷으로 요청 속도를 제한하고, 대기 중인 사용자 분석(INTERACTIVE)이
+# 있으면 백그라운드 갱신(BACKGROUND)은 양보. 429/타임아웃이 나면 그 제공자 전체를
+# 지수 백오프로 잠시 멈추고, 대기 시간이 길면 Throttled 로 빠르게 실패.
+# ---------------------------------------------------------
+INTERACTIVE = 0
+BACKGROUND = 1
+PRIORITY_NAMES = ("interactive", "background")
+
+# 제공자별 (초당 요청 수, 버스트)
+PROVIDER_LIMITS = {
+    "yahoo": (4.0, 8),
+    "news": (2.0, 4),
+    "openai": (1.0, 4),
+}
+DEFAULT_LIMIT = (2.0, 4)
+# 제공자별 재시도 횟수 (429/타임아웃/5xx/연결 오류). 재시도는 백오프가 끝난 뒤 슬롯을 다시 받아서.
+PROVIDER_RETRIES = {
+    "yahoo": 0,
+    "news": 1,
+    "openai": 2,
+}
+QUEUE_TIMEOUT = (10, 60)  # 우선순위별 최대 대기 (초)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+_priority = contextvars.ContextVar("pause_priority", default=INTERACTIVE)
+
+
+class Throttled(Exception):
+    # 제공자가 제한 중이라 대기 한도 안에 요청 슬롯을 받지 못함
+    def __init__(self, provider, retry_in):
+        super().__init__(f"{provider} is rate-limited, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+def _status(exc):
+    for obj in (exc, getattr(exc, "response", None)):
+        code = getattr(obj, "status_code", None) or getattr(obj, "status", None)
+        if isinstance(code, int): return code
+    return None
+
+
+def _chain(exc):
+    # 감싼 예외까지 (requests RetryError -> urllib3 MaxRetryError -> ResponseError 등)
+    seen = set()
+    while isinstance(exc, BaseException) and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        inner = exc.args[0] if exc.args and isinstance(exc.args[0], BaseException) else None
+        exc = getattr(exc, "reason", None) or inner or exc.__cause__ or exc.__context__
+
+
+def is_throttle(exc):
+    # HTTP 429, openai.RateLimitError, yfinance YFRateLimitError, 재시도 끝의 "too many 429 error responses" 등
+    for e in _chain(exc):
+        if _status(e) == 429: return True
+        if type(e).__name__ in ("RateLimitError", "YFRateLimitError"): return True
+        msg = str(e).lower()
+        if "too many requests" in msg or "rate limit" in msg or "too many 429" in msg: return True
+    return False
+
+
+def is_timeout(exc):
+    return any(isinstance(e, TimeoutError) or "timeout" in type(e).__name__.lower() for e in _chain(exc))
+
+
+def _transient(exc):
+    # 백오프 없이 한 번 더 시도할 만한 오류 (5xx, 연결 끊김)
+    for e in _chain(exc):
+        status = _status(e)
+        if isinstance(status, int) and status >= 500: return True
+        if isinstance(e, ConnectionError) or "connection" in type(e).__name__.lower(): return True
+    return False
+
+
+def _retry_after(exc):
+    for e in _chain(exc):
+        headers = getattr(getattr(e, "response", None), "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class _Provider:
+    def __init__(self, name, rate, burst):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.strikes = 0
+        self.waiting = [0] * len(PRIORITY_NAMES)
+        self.throttled = 0
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class Scheduler:
+    def __init__(self, limits=None, queue_timeout=QUEUE_TIMEOUT, retries=None):
+        self.limits = dict(PROVIDER_LIMITS if limits is None else limits)
+        self.retries = dict(PROVIDER_RETRIES if retries is None else retries)
+        self.queue_timeout = queue_timeout
+        self._providers = {}
+        self._cond = threading.Condition()
+
+    def set_limits(self, limits):
+        # 제공자별 (초당 요청 수, 버스트) 교체 (버킷/백오프 상태 초기화)
+        with self._cond:
+            self.limits = dict(limits)
+            self._providers.clear()
+
+    def _provider(self, name):
+        p = self._providers.get(name)
+        if p is None: p = self._providers[name] = _Provider(name, *self.limits.get(name, DEFAULT_LIMIT))
+        return p
+
+    @contextlib.contextmanager
+    def priority(self, level):
+        # with scheduler.priority(BACKGROUND): ...   (이 컨텍스트의 외부 요청 우선순위)
+        token = _priority.set(level)
+        try:
+            yield
+        finally:
+            _priority.reset(token)
+
+    def _gauge(self, p, prio):
+        metrics.gauge("sched_queue_depth", p.waiting[prio], provider=p.name, priority=PRIORITY_NAMES[prio])
+
+    def _acquire(self, name, prio):
+        deadline = time.monotonic() + self.queue_timeout[prio]
+        with self._cond:
+            p = self._provider(name)
+            p.waiting[prio] += 1
+            self._gauge(p, prio)
+            try:
+                while True:
+                    now = time.monotonic()
+                    p.refill(now)
+                    yielding = any(p.waiting[:prio])  # 더 높은 우선순위가 기다리는 중
+                    if not yielding and now >= p.paused_until and p.tokens >= 1:
+                        p.tokens -= 1
+                        return
+                    if p.paused_until > deadline: raise Throttled(name, p.paused_until - now)
+                    if now >= deadline: raise Throttled(name, max(p.paused_until - now, 1 / p.rate))
+                    delay = max(p.paused_until - now, (1 - p.tokens) / p.rate, 0.01)
+                    self._cond.wait(min(delay, deadline - now))
+            finally:
+                p.waiting[prio] -= 1
+                self._gauge(p, prio)
+                self._cond.notify_all()
+
+    def _penalize(self, name, exc):
+        with self._cond:
+            p = self._provider(name)
+            p.strikes += 1
+            p.throttled += 1
+            delay = _retry_after(exc) or min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (p.strikes - 1)) * random.uniform(0.8, 1.2)
+            p.paused_until = max(p.paused_until, time.monotonic() + delay)
+            p.tokens = 0.0
+            metrics.gauge("sched_backoff_seconds", delay, provider=name)
+
+    def _reward(self, name):
+        with self._cond:
+            p = self._provider(name)
+            if p.strikes: p.strikes -= 1
+
+    def call(self, provider, fn, *args, **kwargs):
+        # 슬롯을 받은 뒤 fn 실행. 429/타임아웃이면 제공자 백오프, 재시도 횟수가 남았으면
+        # 백오프가 끝난 뒤 다시 (백오프가 대기 한도를 넘으면 Throttled), 아니면 예외 전파.
+        prio = _priority.get()
+        attempts = self.retries.get(provider, 0) + 1
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                self._acquire(provider, prio)
+            finally:
+                metrics.record(f"sched.{provider}.wait", time.perf_counter() - start)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                limited = is_throttle(e) or is_timeout(e)
+                if limited: self._penalize(provider, e)
+                if attempt + 1 < attempts and (limited or _transient(e)):
+                    if not limited: time.sleep(BACKOFF_BASE * (attempt + 1) * random.uniform(0.5, 1.0))
+                    continue
+                raise
+            self._reward(provider)
+            return result
+
+    def status(self, provider):
+        # UI 용: {"paused_for": 남은 백오프 초, "queued": 대기 수, "throttled": 누적 제한 횟수}
+        with self._cond:
+            p = self._provider(provider)
+            return {"paused_for": max(0.0, p.paused_until - time.monotonic()), "queued": sum(p.waiting), "throttled": p.throttled}
+
+    def stats(self):
+        with self._cond:
+            now = time.monotonic()
+            for p in self._providers.values(): p.refill(now)
+            return {name: {"tokens": round(p.tokens, 2), "paused_for": round(max(0.0, p.paused_until - now), 1),
+                           "strikes": p.strikes, "throttled": p.throttled,
+                           **{f"queued_{n}": p.waiting[i] for i, n in enumerate(PRIORITY_NAMES)}}
+                    for name, p in self._providers.items()}
+
+
+# 프로세스 전역 스케줄러
+scheduler = Scheduler()
@@ -0,0 +1,202 @@
+import argparse
+import re
+import sys
+import threading
+import time
+
+from pause import indicators
+from pause.metrics import metrics
+from pause.prompts import BATCH_SHORT_SYS_MSG, batch_user_msg, compact_summary, normalize_verdict
+
+# ---------------------------------------------------------
+# 워치리스트 스크리닝 (다종목 일괄 분석)
+# ---------------------------------------------------------
+CHUNK_SIZE = 100
+MIN_BARS = 21  # 20일 거래량 평균 + 1
+
+COLUMNS = ["ticker", "price", "chg_pct", "ema5", "trend", "stoch_k", "vol_ratio", "candle",
+           "rsi", "bb_lower", "bb_upper", "bb_pos"]
+
+
+def parse_watchlist(text):
+    seen, out = set(), []
+    for tok in re.split(r"[\s,;]+", text or ""):
+        tok = tok.strip().upper()
+        if tok and not tok.startswith("#") and tok not in seen:
+            seen.add(tok)
+            out.append(tok)
+    return out
+
+
+def download_histories(tickers, period="6mo"):
+    # yf.download 한 번으로 여러 종목 히스토리 조회 -> {ticker: DataFrame}
+    import yfinance as yf
+    import pandas as pd
+    from pause.scheduler import scheduler
+    raw = scheduler.call("yahoo", yf.download, tickers, period=period, group_by="ticker", auto_adjust=True, threads=True, progress=False)
+    if raw is None or raw.empty: return {}
+    if not isinstance(raw.columns, pd.MultiIndex):
+        return {tickers[0]: raw.dropna(how="all")}
+    out = {}
+    for t in tickers:
+        if t not in raw.columns.get_level_values(0): continue
+        h = raw[t].dropna(how="all")
+        if not h.empty: out[t] = h
+    return out
+
+
+def screen_row(ticker, df, ind):
+    # ind: IndicatorState.rows() 의 해당 종목 값
+    if df is None or len(df) < MIN_BARS or ind is None: return None
+    price = float(df['Close'].iloc[-1])
+    prev = float(df['Close'].iloc[-2])
+    band = ind["bb_upper"] - ind["bb_lower"]
+    return {
+        "ticker": ticker,
+        "price": round(price, 2),
+        "chg_pct": round((price / prev - 1) * 100, 2) if prev else None,
+        "ema5": round(ind["ema5"], 2),
+        "trend": ind["trend"],
+        "stoch_k": round(ind["stoch_k"], 1),
+        "vol_ratio": round(ind["vol_ratio"], 0),
+        "candle": "GREEN" if ind["is_green"] else "RED",
+        "rsi": round(ind["rsi"], 1),
+        "bb_lower": round(ind["bb_lower"], 2),
+        "bb_upper": round(ind["bb_upper"], 2),
+        "bb_pos": round((price - ind["bb_lower"]) / band, 2) if band else None,
+    }
+
+
+def chunk_indicators(hists):
+    # 청크 전체를 (날짜 × 종목) 패널로 묶어 지표를 한 번에 계산 -> {ticker: 지표 dict}
+    hists = {t: h for t, h in hists.items() if len(h) >= MIN_BARS}
+    if not hists: return {}
+    try:
+        return indicators.IndicatorState.from_panel(indicators.make_panel(hists)).rows()
+    except Exception:
+        return {}
+
+
+def screen(tickers, period="6mo", chunk_size=CHUNK_SIZE):
+    # 청크 단위로 다운로드/계산하여 결과 행을 순차적으로 yield (스트리밍)
+    for i in range(0, len(tickers), chunk_size):
+        chunk = tickers[i:i + chunk_size]
+        try:
+            with metrics.timed("screen.download"): hists = download_histories(chunk, period)
+        except Exception:
+            hists = {}
+        with metrics.timed("screen.indicators"): inds = chunk_indicators(hists)
+        for t in chunk:
+            row = screen_row(t, hists.get(t), inds.get(t))
+            if row: yield row
+
+
+# ---------------------------------------------------------
+# 선택적 AI 판정 (속도 제한)
+# ---------------------------------------------------------
+class RateLimiter:
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0: time.sleep(delay)
+
+
+def rank_candidates(rows, top_n):
+    # 상승 추세 + 거래량 증가 + 과매수 아님 순으로 상위 후보 선정
+    def score(r):
+        return (r["trend"] == "BULLISH", r["candle"] == "GREEN", r["stoch_k"] < 80, r["vol_ratio"] or 0)
+    return sorted(rows, key=score, reverse=True)[:top_n]
+
+
+def ai_verdicts(rows, api_key, top_n=10, per_minute=20, macro_txt="VIX: N/A", client=None):
+    # 상위 top_n 종목만 LLM 판정. 캐시 미스 종목만 BATCH_SIZE 개씩 묶어 요청. {ticker: verdict}
+    from pause.clients import openai_client
+    from pause.llm import chat_json_batch, token_budget
+    from pause.verdict_cache import verdict_cache, make_key
+    out, keys, misses = {}, {}, {}
+    vix = re.search(r"[\d.]+", macro_txt)
+    vix = float(vix.group()) if vix else None
+    for r in rank_candidates(rows, top_n):
+        t = r["ticker"]
+        keys[t] = make_key(t, "screen", {"price": r["price"], "trend": r["trend"], "stoch_k": r["stoch_k"], "vol_ratio": r["vol_ratio"],
+                                         "is_green": r["candle"] == "GREEN", "vix": vix})
+        with metrics.timed("llm.screen.lookup") as m:
+            hit = verdict_cache.get(keys[t])
+            m.cache = "miss" if hit is None else "hit"
+        if hit is None: misses[t] = compact_summary(r)
+        else: out[t] = normalize_verdict(hit.get("verdict", "WAIT"))
+    if not misses: return out
+
+    try:
+        with metrics.timed("llm.screen.batch"):
+            got = chat_json_batch(client or openai_client(api_key), BATCH_SHORT_SYS_MSG, misses, lambda s: batch_user_msg(s, macro_txt),
+                                  budget=token_budget, limiter=RateLimiter(per_minute))
+    except Exception:
+        got = {}
+    for t in misses:
+        if t in got: verdict_cache.set(keys[t], got[t], t, "screen")
+        out[t] = got[t]["verdict"] if t in got else "N/A"
+    return out
+
+
+def to_csv(rows):
+    import csv
+    import io
+    cols = COLUMNS + (["verdict"] if rows and "verdict" in rows[0] else [])
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=cols)
+    w.writeheader()
+    w.writerows(rows)
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------
+# CLI: python -m pause.screener watchlist.txt [--out result.csv] [--ai 10]
+# ---------------------------------------------------------
+def main(argv=None):
+    import os
+    p = argparse.ArgumentParser(description="PAUSE watchlist screener")
+    p.add_argument("watchlist", help="file with tickers (comma/space/newline separated), or '-' for stdin")
+    p.add_argument("--period", default="6mo")
+    p.add_argument("--sort", default="vol_ratio", choices=COLUMNS)
+    p.add_argument("--asc", action="store_true")
+    p.add_argument("--out", help="write CSV here instead of stdout")
+    p.add_argument("--ai", type=int, default=0, metavar="N", help="AI verdict for top N candidates (needs OPENAI_API_KEY)")
+    p.add_argument("--ai-per-minute", type=int, default=20)
+    args = p.parse_args(argv)
+
+    text = sys.stdin.read() if args.watchlist == "-" else open(args.watchlist).read()
+    tickers = parse_watchlist(text)
+    rows = []
+    start = time.time()
+    for row in screen(tickers, args.period):
+        rows.append(row)
+        print(f"[{len(rows)}/{len(tickers)}] {row['ticker']}", file=sys.stderr)
+    print(f"screened {len(rows)}/{len(tickers)} in {time.time() - start:.1f}s", file=sys.stderr)
+
+    if args.ai:
+        from pause.macro import fetch_macro
+        try: macro = fetch_macro()
+        except Exception: macro = None
+        macro_txt = f"VIX: {macro['vix']:.2f}" if macro else "VIX: N/A"
+        verdicts = ai_verdicts(rows, os.environ["OPENAI_API_KEY"], args.ai, args.ai_per_minute, macro_txt)
+        for r in rows: r["verdict"] = verdicts.get(r["ticker"], "")
+
+    missing = [r for r in rows if r[args.sort] is None]
+    rows = sorted((r for r in rows if r[args.sort] is not None), key=lambda r: r[args.sort], reverse=not args.asc) + missing
+    out = to_csv(rows)
+    if args.out:
+        with open(args.out, "w", newline="") as f: f.write(out)
+    else:
+        sys.stdout.write(out)
+
+
+if __name__ == "__main__":
+    main()
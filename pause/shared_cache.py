@@ -0,0 +1,181 @@
+import contextlib
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+
+# ---------------------------------------------------------
+# 워커 간 공유 캐시 (여러 Streamlit 프로세스를 로드밸런서 뒤에서 돌릴 때)
+# PAUSE_SHARED_CACHE = "redis://host:6379/0"  -> redis-py (선택 의존성)
+#                    = "sqlite:///path/to/shared.sqlite" 또는 파일 경로 -> LocalRedis
+# 설정이 없으면 shared_cache 는 None 이고 모든 캐시는 프로세스 내부에서만 동작.
+# 키마다 SET NX EX 잠금을 잡아 한 워커만 원본을 조회하고 나머지는 결과를 기다림.
+# ---------------------------------------------------------
+PREFIX = "pause:"
+LOCK_TTL = 30  # 잠금 보유자가 죽어도 이 시간 후 자동 해제
+LOCK_WAIT = 15  # 다른 워커의 조회를 기다리는 최대 시간, 넘으면 직접 조회
+POLL = 0.05
+PURGE_EVERY = 10 * 60  # LocalRedis 만료 행 정리 간격 (초)
+
+_MISS = object()
+
+
+class LocalRedis:
+    # Redis 명령 일부(get / set ex·nx / delete)를 SQLite 파일 하나로 구현한 로컬 대체물.
+    # 같은 호스트의 워커들이 같은 파일을 열면 공유됨 (WAL).
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._purged = 0.0
+
+    def _con(self):
+        con = getattr(self._local, "con", None)
+        if con is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            con = self._local.con = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+            con.execute("CREATE INDEX IF NOT EXISTS kv_expires ON kv (expires)")
+        return con
+
+    def get(self, name):
+        row = self._con().execute("SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)", (name, time.time())).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def set(self, name, value, ex=None, nx=False):
+        if isinstance(value, str): value = value.encode()
+        now = time.time()
+        expires = None if ex is None else now + ex
+        con = self._con()
+        # Redis 와 달리 만료 키가 저절로 지워지지 않으므로 쓰기 때 주기적으로 일괄 삭제
+        if time.monotonic() - self._purged >= PURGE_EVERY:
+            self._purged = time.monotonic()
+            con.execute("DELETE FROM kv WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        if not nx:
+            con.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?)", (name, value, expires))
+            return True
+        # 만료된 키 정리 + 삽입을 한 트랜잭션으로 (워커 간 원자적)
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.execute("DELETE FROM kv WHERE key = ? AND expires IS NOT NULL AND expires <= ?", (name, now))
+            added = con.execute("INSERT OR IGNORE INTO kv VALUES (?, ?, ?)", (name, value, expires)).rowcount == 1
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        return True if added else None
+
+    def delete(self, *names):
+        con = self._con()
+        return sum(con.execute("DELETE FROM kv WHERE key = ?", (n,)).rowcount for n in names)
+
+
+def connect(url):
+    # 설정 문자열 -> Redis 호환 클라이언트 (없으면 None)
+    if not url: return None
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+        return redis.Redis.from_url(url)
+    return LocalRedis(url[len("sqlite://"):] if url.startswith("sqlite://") else url)
+
+
+class SharedCache:
+    def __init__(self, backend, prefix=PREFIX, lock_ttl=LOCK_TTL, lock_wait=LOCK_WAIT):
+        self.backend = backend
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+
+    def _key(self, kind, key):
+        return f"{self.prefix}{kind}:{key}"
+
+    def lookup(self, kind, key):
+        # -> (값, 남은 TTL 초). 없거나 백엔드 오류면 (_MISS, 0)
+        try:
+            raw = self.backend.get(self._key(kind, key))
+        except Exception:
+            return _MISS, 0
+        if raw is None: return _MISS, 0
+        expires_at, value = pickle.loads(raw)
+        left = expires_at - time.time()
+        return (value, left) if left > 0 else (_MISS, 0)
+
+    def get(self, kind, key, default=None):
+        value, _ = self.lookup(kind, key)
+        return default if value is _MISS else value
+
+    def set(self, kind, key, value, ttl):
+        try:
+            self.backend.set(self._key(kind, key), pickle.dumps((time.time() + ttl, value), protocol=pickle.HIGHEST_PROTOCOL), ex=max(1, math.ceil(ttl)))
+        except Exception:
+            pass
+
+    def delete(self, kind, key):
+        try:
+            self.backend.delete(self._key(kind, key))
+        except Exception:
+            pass
+
+    @contextlib.contextmanager
+    def lock(self, kind, key):
+        # 워커 간 단일 잠금. 잡았으면 True, 다른 워커가 보유 중이면 False (기다리지 않음)
+        name = self._key("lock:" + kind, key)
+        token = uuid.uuid4().hex.encode()
+        try:
+            held = bool(self.backend.set(name, token, ex=self.lock_ttl, nx=True))
+        except Exception:
+            held = True  # 백엔드 장애 시 잠금 없이 진행
+            name = None
+        try:
+            yield held
+        finally:
+            if held and name is not None:
+                try:
+                    if self.backend.get(name) == token: self.backend.delete(name)
+                except Exception:
+                    pass
+
+    def wait(self, kind, key, timeout=None):
+        # 다른 워커가 값을 채울 때까지 (최대 timeout 초) 폴링
+        deadline = time.monotonic() + (self.lock_wait if timeout is None else timeout)
+        while time.monotonic() < deadline:
+            value, left = self.lookup(kind, key)
+            if value is not _MISS: return value, left
+            time.sleep(POLL)
+        return _MISS, 0
+
+    def fetch_through(self, kind, key, fetch, ttl):
+        # -> (값, 남은 TTL). 공유 캐시 적중이면 그대로, 아니면 잠금을 잡은 한 워커만 fetch().
+        # None 결과(조회 실패)는 공유하지 않음
+        value, left = self.lookup(kind, key)
+        if value is not _MISS: return value, left
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            with self.lock(kind, key) as held:
+                if held:
+                    value, left = self.lookup(kind, key)  # 잠금 사이에 다른 워커가 채웠을 수 있음
+                    if value is not _MISS: return value, left
+                    value = fetch()
+                    if value is not None: self.set(kind, key, value, ttl)
+                    return value, ttl
+            value, left = self.wait(kind, key, min(1.0, deadline - time.monotonic()))
+            if value is not _MISS: return value, left
+        # 잠금 보유자가 너무 오래 걸리면 직접 조회
+        value = fetch()
+        if value is not None: self.set(kind, key, value, ttl)
+        return value, ttl
+
+    def get_or_fetch(self, kind, key, fetch, ttl):
+        return self.fetch_through(kind, key, fetch, ttl)[0]
+
+
+def from_env():
+    backend = connect(os.environ.get("PAUSE_SHARED_CACHE"))
+    return None if backend is None else SharedCache(backend)
+
+
+# 프로세스 전역 공유 캐시 (PAUSE_SHARED_CACHE 미설정 시 None)
+shared_cache = from_env()
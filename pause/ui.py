@@ -0,0 +1,171 @@
+import hmac
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+
+import streamlit as st
+
+from pause.cache import market_cache
+from pause.clients import openai_client
+from pause.llm import chat_json_stream
+from pause.macro import macro_refresher
+from pause.metrics import metrics
+from pause.prompts import normalize_verdict
+from pause.quotes import quote_service
+from pause.scheduler import Throttled, is_throttle, scheduler
+from pause.verdict_cache import verdict_cache
+
+# ---------------------------------------------------------
+# 공용 UI (스타일 / 세션 콜백 / 렌더 헬퍼)
+# 모듈로 분리해 재실행마다 다시 정의되지 않도록 함
+# ---------------------------------------------------------
+ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+@lru_cache(maxsize=None)
+def load_asset(name):
+    with open(os.path.join(ASSETS, name), encoding="utf-8") as f: return f.read()
+
+def inject_css():
+    st.markdown(f"<style>\n{load_asset('style.css')}</style>", unsafe_allow_html=True)
+
+def init_session():
+    if 'analyzed_short' not in st.session_state: st.session_state.analyzed_short = False
+    if 'analyzed_swing' not in st.session_state: st.session_state.analyzed_swing = False
+    if 'active_tab' not in st.session_state: st.session_state.active_tab = "short"
+
+def cb_home():
+    st.session_state.analyzed_short = False
+    st.session_state.analyzed_swing = False
+
+def cb_focus_short():
+    st.session_state.active_tab = "short"
+
+def cb_focus_swing():
+    st.session_state.active_tab = "swing"
+
+def cb_analyze_short():
+    cb_focus_short()
+    st.session_state.analyzed_short = True
+    st.session_state.analyzed_swing = False 
+
+def cb_analyze_swing():
+    cb_focus_swing()
+    st.session_state.analyzed_swing = True
+    st.session_state.analyzed_short = False
+
+# ---------------------------------------------------------
+# 렌더 헬퍼
+# ---------------------------------------------------------
+QUOTE_POLL = 5  # Est. $ 필드만 다시 그리는 주기 (초)
+
+@st.fragment(run_every=QUOTE_POLL)
+def est_value(tab, sym, qty, key):
+    # 마지막으로 알려진 가격으로 즉시 렌더, 갱신은 사용 중인 탭의 종목만 백그라운드에서.
+    # 탭 전환은 콜백이 없으므로 가격이 아직 없는 종목은 다른 탭이어도 한 번은 조회.
+    price = quote_service.peek(sym, refresh=False)
+    quote_service.peek(sym, refresh=st.session_state.active_tab == tab or price is None)
+    # 키가 있는 위젯은 첫 값을 유지하므로 매번 session_state 로 값을 덮어씀
+    st.session_state[key] = f"${price*qty:,.0f}" if price else "…"
+    st.text_input("Est. $", disabled=True, key=key)
+
+def macro_status_caption():
+    ms = macro_refresher.status()
+    if ms['updated_at'] is None: return "🌐 Macro: loading..."
+    label = f"🌐 Macro as of {datetime.fromtimestamp(ms['updated_at']):%H:%M:%S} ({ms['age']:.0f}s ago)"
+    return label + " ⚠️ stale" if ms['stale'] else label
+
+PROVIDER_LABELS = {"yahoo": "Yahoo Finance", "news": "Google News", "openai": "OpenAI"}
+
+def provider_error(provider, fallback_msg, exc=None):
+    # 제한(429/백오프) 중이면 빈 화면 대신 재시도 안내, 그 외 실패는 fallback_msg
+    wait = exc.retry_in if isinstance(exc, Throttled) else scheduler.status(provider)["paused_for"]
+    if wait > 0 or (exc is not None and is_throttle(exc)):
+        st.warning(f"⏳ {PROVIDER_LABELS.get(provider, provider)} is rate-limiting requests right now. Please retry in ~{max(wait, 1):.0f}s.")
+    else:
+        st.error(fallback_msg)
+
+def safe_display_list(data_list, fallback_msg):
+    if isinstance(data_list, list):
+        for item in data_list: st.markdown(f"- {item}")
+    elif isinstance(data_list, str): st.markdown(f"- {data_list}")
+    else: st.markdown(f"- {fallback_msg}")
+
+def safe_float(val, fallback):
+    try:
+        if val is None: return fallback
+        if isinstance(val, str) and "N/A" in val: return fallback
+        return float(val)
+    except:
+        return fallback
+
+def stream_ai(api_key, key, ticker, mode, sys_msg, user_msg, render):
+    # 캐시 적중이면 즉시, 아니면 토큰이 도착할 때마다 render(부분 응답, False) 후 최종 응답 저장
+    with metrics.timed(f"llm.{mode}") as t:
+        ai = verdict_cache.get(key)
+        t.cache = "miss" if ai is None else "hit"
+        if ai is None:
+            # 다른 워커가 같은 판정을 생성 중이면 그 결과를 기다림
+            with verdict_cache.lock(key) as held:
+                ai = verdict_cache.get(key) if held else verdict_cache.wait(key)
+                if ai is not None: t.cache = "shared"
+                else:
+                    start, first = time.perf_counter(), True
+                    for ai in chat_json_stream(openai_client(api_key), sys_msg, user_msg):
+                        if first:
+                            metrics.record(f"llm.{mode}.first_token", time.perf_counter() - start)
+                            first = False
+                        render(ai, False)
+                    verdict_cache.set(key, ai, ticker, mode)
+        render(ai, True)
+    return ai
+
+def render_verdict(ph, ai, done, color_go, div_style="", h1_style=""):
+    # 판정이 완성되기 전('G', 'WA' 등)에는 대기 박스 표시
+    v = ai.get('verdict')
+    if not done and v not in ("GO", "WAIT"):
+        ph.markdown("""<div class="verdict-box" style="background-color:#333;"><h1 style="color:#888; margin:0;">…</h1></div>""", unsafe_allow_html=True)
+        return
+    verdict = normalize_verdict(ai.get('verdict', 'WAIT'))
+    color = color_go if verdict == "GO" else "#FF4B4B"
+    ph.markdown(f"""<div class="verdict-box" style="background-color:{color};{div_style}"><h1 style="{h1_style}margin:0;">{verdict}</h1></div>""", unsafe_allow_html=True)
+
+def render_price(ph, label, val, fallback, done):
+    val = safe_float(val, fallback if done else None)
+    ph.metric(label, f"${val:.2f}" if val is not None else "…")
+
+def render_list(ph, data_list, fallback_msg, done):
+    with ph.container(): safe_display_list(data_list, fallback_msg if done else "…")
+
+def price_chart(ticker, df, key, ema_span=None):
+    # 기간/봉 간격을 바꿔도 다시 받지 않음: 분석 시 로컬 OHLCV 저장소를 charts.STORE_PERIOD 까지 채워 두고 그걸 씀
+    # plotly 는 pause.charts 가 차트를 실제로 그릴 때 처음 import
+    from pause import charts
+    from pause.ohlcv_store import ohlcv_store
+    stored = ohlcv_store.load(ticker)
+    src = stored if stored is not None and len(stored) > len(df) and stored.index[-1] >= df.index[-1] else df
+    # 데이터가 덮지 못하는 기간은 보여주지 않음 (상장 직후 종목 등)
+    periods = charts.available_periods(src)
+    if st.session_state.get(f"{key}_period") not in periods: st.session_state.pop(f"{key}_period", None)
+    default = periods.index(charts.DEFAULT_PERIOD) if charts.DEFAULT_PERIOD in periods else len(periods) - 1
+    c1, c2 = st.columns(2)
+    period = c1.radio("Period", periods, index=default, horizontal=True, key=f"{key}_period")
+    interval = c2.radio("Interval", list(charts.INTERVALS), horizontal=True, key=f"{key}_interval")
+    with metrics.timed("chart"):
+        fig = charts.cached_figure(ticker, src, period, interval, ema_span=ema_span)
+    st.plotly_chart(fig, use_container_width=True)
+
+def debug_enabled():
+    # PAUSE_DEBUG=토큰 이 설정된 경우에만, ?debug=<같은 토큰> 으로 디버그 패널 표시 (익명 방문자에게 내부 상태 비노출)
+    token = os.environ.get("PAUSE_DEBUG")
+    given = st.query_params.get("debug")
+    return bool(token and given) and hmac.compare_digest(given.encode(), token.encode())
+
+def debug_panel():
+    with st.expander("🛠️ Timings (rolling p50 / p95 per stage)", expanded=True):
+        snap = metrics.snapshot()
+        st.dataframe([{"stage": k, **v} for k, v in snap.items()], use_container_width=True, hide_index=True)
+        st.json(market_cache.stats(), expanded=False)
+        st.dataframe([{"provider": k, **v} for k, v in scheduler.stats().items()], use_container_width=True, hide_index=True)
+        st.code(metrics.prometheus(), language="text")
@@ -0,0 +1,156 @@
+import contextlib
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from pause.shared_cache import POLL, shared_cache
+
+# ---------------------------------------------------------
+# LLM 판정 영구 캐시 (SQLite)
+# 키 = 종목 + 모드 + 리스크 + 버킷화된 지표 값 + 뉴스/실적 지문.
+# 새 뉴스나 실적일 변경은 지문이 바뀌므로 자동으로 캐시 미스.
+# 공유 캐시가 있으면 다른 호스트의 워커와도 판정을 나누고, 키별 잠금으로 한 워커만 LLM 호출.
+# ---------------------------------------------------------
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pause", "verdicts.sqlite")
+DEFAULT_TTL = 30 * 60
+PURGE_EVERY = 10 * 60  # 만료된 행 정리 간격 (초, 쓰기 때 확인)
+
+# 지표별 버킷 크기 (이 범위 안의 변화는 같은 판정으로 취급)
+BUCKETS = {
+    "stoch_k": 5,
+    "vol_ratio": 10,
+    "rsi": 2,
+    "vix": 1,
+    "mk_cap": 10,
+    "pe": 1,
+}
+PRICE_SIG = 3  # 가격류는 유효숫자 3자리로 버킷화
+
+
+def _bucket(name, value):
+    if isinstance(value, bool) or value is None or isinstance(value, str): return value
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if math.isnan(value) or math.isinf(value): return None
+    step = BUCKETS.get(name)
+    if step: return round(value / step) * step
+    if value == 0: return 0.0
+    return round(value, PRICE_SIG - 1 - int(math.floor(math.log10(abs(value)))))
+
+
+def fingerprint(items):
+    # 뉴스 제목 목록 등 -> 짧은 해시
+    h = hashlib.sha1()
+    for s in items or []: h.update(str(s).encode("utf-8", "replace") + b"\0")
+    return h.hexdigest()[:16]
+
+
+def make_key(ticker, mode, inputs, risk=None, news=None, earnings_date=None):
+    payload = {
+        "ticker": ticker.upper(),
+        "mode": mode,
+        "risk": risk,
+        "inputs": {k: _bucket(k, v) for k, v in sorted(inputs.items())},
+        "news": fingerprint(news),
+        "earnings": str(earnings_date),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class VerdictCache:
+    def __init__(self, path=None, ttl=None, shared=None):
+        self.path = path or os.environ.get("PAUSE_VERDICT_CACHE", DEFAULT_PATH)
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._ready = False
+        self._purged = 0.0
+
+    def _connect(self):
+        # OSError(디렉터리 생성 실패)/sqlite3.Error 는 호출 쪽에서 캐시 미스로 처리 -> 분석 경로를 막지 않음
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        con = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            with self._lock:
+                con.execute("PRAGMA journal_mode=WAL")
+                con.execute("CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, ticker TEXT, mode TEXT, created REAL, response TEXT)")
+                con.execute("CREATE INDEX IF NOT EXISTS verdicts_created ON verdicts (created)")
+                con.commit()
+                self._ready = True
+        return con
+
+    def get(self, key):
+        try:
+            con = self._connect()
+            try:
+                row = con.execute("SELECT created, response FROM verdicts WHERE key = ?", (key,)).fetchone()
+            finally:
+                con.close()
+        except (sqlite3.Error, OSError):
+            row = None
+        if row is not None and row[0] + self.ttl > time.time(): return json.loads(row[1])
+        if self.shared is not None: return self.shared.get("verdict", key)
+        return None
+
+    def set(self, key, response, ticker="", mode=""):
+        try:
+            con = self._connect()
+            try:
+                con.execute("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)", (key, ticker.upper(), mode, time.time(), json.dumps(response)))
+                # 키는 버킷화된 입력의 해시라 계속 늘어나므로 만료된 행을 주기적으로 삭제
+                now = time.monotonic()
+                if now - self._purged >= PURGE_EVERY:
+                    self._purged = now
+                    self._purge(con)
+                con.commit()
+            finally:
+                con.close()
+        except (sqlite3.Error, OSError):
+            pass
+        if self.shared is not None: self.shared.set("verdict", key, response, self.ttl)
+
+    def _purge(self, con):
+        con.execute("DELETE FROM verdicts WHERE created <= ?", (time.time() - self.ttl,))
+
+    def lock(self, key):
+        # 워커 간 키별 잠금: 잡았으면 True (공유 캐시가 없으면 항상 True)
+        if self.shared is None: return contextlib.nullcontext(True)
+        return self.shared.lock("verdict", key)
+
+    def wait(self, key, timeout=None):
+        # 잠금을 가진 다른 워커의 판정을 기다림 (timeout 초 안에 없으면 None)
+        if self.shared is None: return None
+        deadline = time.monotonic() + (self.shared.lock_wait if timeout is None else timeout)
+        while time.monotonic() < deadline:
+            hit = self.get(key)
+            if hit is not None: return hit
+            time.sleep(POLL)
+        return None
+
+    def invalidate(self, ticker=None):
+        # 로컬 행과 같은 키의 공유 캐시 항목을 함께 삭제 (다른 호스트만 가진 키는 TTL 로 만료)
+        keys = []
+        try:
+            con = self._connect()
+            try:
+                where, args = ("", ()) if ticker is None else (" WHERE ticker = ?", (ticker.upper(),))
+                keys = [k for k, in con.execute("SELECT key FROM verdicts" + where, args)]
+                con.execute("DELETE FROM verdicts" + where, args)
+                self._purge(con)
+                con.commit()
+            finally:
+                con.close()
+        except (sqlite3.Error, OSError):
+            pass
+        if self.shared is not None:
+            for k in keys: self.shared.delete("verdict", k)
+
+
+# 프로세스 전역 판정 캐시 (TTL 은 PAUSE_VERDICT_TTL 초로 조정)
+verdict_cache = VerdictCache(ttl=float(os.environ.get("PAUSE_VERDICT_TTL", DEFAULT_TTL)), shared=shared_cache)
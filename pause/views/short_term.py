@@ -0,0 +1,85 @@
+import streamlit as st
+
+from pause import indicators
+from pause.data import get_analysis_inputs
+from pause.metrics import metrics
+from pause.prompts import SHORT_SYS_MSG, short_user_msg
+from pause.ui import (cb_analyze_short, cb_focus_short, cb_home, est_value, macro_status_caption,
+                      price_chart, provider_error, render_list, render_price, render_verdict, stream_ai)
+from pause.verdict_cache import make_key
+
+# ---------------------------------------------------------
+# TAB 1: SHORT-TERM
+# ---------------------------------------------------------
+def render(api_key):
+    c1, c2, c3 = st.columns(3)
+    with c1: sym_s = st.text_input("Ticker", "TSLA", key="t_s", on_change=cb_analyze_short).strip().upper()
+    with c2: qty_s = st.number_input("Qty", 1, value=100, key="q_s", on_change=cb_focus_short)
+    with c3: est_value("short", sym_s, qty_s, "e_s")
+
+    st.markdown('<div class="stButton action-btn">', unsafe_allow_html=True)
+    st.button("⚡ Analyze Momentum", use_container_width=True, on_click=cb_analyze_short, key="btn_s")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if st.session_state.analyzed_short:
+        with st.spinner("Scanning..."):
+            d, news_items, macro = get_analysis_inputs(sym_s)
+            if not d: provider_error("yahoo", "Error fetching data.")
+            else:
+                df = d['hist']
+                curr_price = d['price']
+                st.markdown(f"""<div class="company-header"><p class="company-ticker">{sym_s}</p><p class="company-name">{d['name']}</p></div>""", unsafe_allow_html=True)
+
+                if d['earnings_warning']: st.error(f"⚠️ Earnings Report on {d['earnings_date']}")
+
+                try:
+                    with metrics.timed("ind.short"):
+                        ind = indicators.short_term_snapshot(df)
+                    ema5_val = ind['ema5']
+                    trend_str = "BULLISH" if curr_price > ema5_val else "BEARISH"
+                    stoch_k = ind['stoch_k']
+                    vol_ratio = ind['vol_ratio']
+                    is_green = ind['is_green']
+                except:
+                    ema5_val = curr_price
+                    stoch_k = 50
+                    vol_ratio = 100
+                    trend_str = "Unknown"
+                    is_green = True
+
+                news_text = "\n".join([f"- {n['title']}" for n in news_items]) if news_items else "No news."
+                macro_txt = f"VIX: {macro['vix']:.2f}" if macro else "VIX: N/A"
+                st.caption(macro_status_caption())
+
+                user_msg = short_user_msg(sym_s, curr_price, ema5_val, trend_str, stoch_k, vol_ratio, is_green, macro_txt, news_text)
+
+                ai_key = make_key(sym_s, "short", {"price": curr_price, "trend": trend_str, "stoch_k": stoch_k, "vol_ratio": vol_ratio, "is_green": is_green, "vix": macro['vix'] if macro else None},
+                                  news=[n['title'] for n in news_items], earnings_date=d['earnings_date'])
+
+                # 시장 데이터(현재가, 차트)는 즉시 그리고 AI 응답 영역은 placeholder 로 점진 갱신
+                verdict_ph = st.empty()
+
+                st.markdown('<div class="stButton action-btn">', unsafe_allow_html=True)
+                st.button("🔄 Check Another Stock", type="secondary", use_container_width=True, on_click=cb_home, key="reset_s")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Current", f"${curr_price:.2f}")
+                tp_ph, sl_ph = c2.empty(), c3.empty()
+
+                st.divider()
+                st.subheader("📝 Analysis")
+                reason_ph = st.empty()
+
+                price_chart(sym_s, df, "chart_s", ema_span=indicators.EMA_SPAN)
+
+                def render_short(ai, done):
+                    render_verdict(verdict_ph, ai, done, "#00FF99", div_style=" color:black;")
+                    render_price(tp_ph, "Target", ai.get('target_tomorrow'), curr_price * 1.02, done)
+                    render_price(sl_ph, "Stop Loss", ai.get('stop_loss'), curr_price * 0.98, done)
+                    render_list(reason_ph, ai.get('reasoning_list'), "No data.", done)
+
+                try: stream_ai(api_key, ai_key, sym_s, "short", SHORT_SYS_MSG, user_msg, render_short)
+                except Exception as e:
+                    provider_error("openai", "AI analysis failed. Please try again.", e)
+                    st.stop()
@@ -0,0 +1,96 @@
+import streamlit as st
+
+from pause import indicators
+from pause.data import get_analysis_inputs
+from pause.metrics import metrics
+from pause.prompts import SWING_SYS_MSG, swing_user_msg
+from pause.ui import (cb_analyze_swing, cb_focus_swing, cb_home, est_value, macro_status_caption,
+                      price_chart, provider_error, render_list, render_price, render_verdict, stream_ai)
+from pause.verdict_cache import make_key
+
+# ---------------------------------------------------------
+# TAB 2: SWING
+# ---------------------------------------------------------
+def render(api_key):
+    risk = st.selectbox("Risk Profile", ["Conservative", "Moderate", "Aggressive"], index=1, on_change=cb_focus_swing)
+
+    c1, c2, c3 = st.columns(3)
+    # [FIX] on_change 추가: 엔터키 누르면 cb_analyze_swing 실행
+    with c1: sym_w = st.text_input("Ticker", "NVDA", key="t_w", on_change=cb_analyze_swing).strip().upper()
+    with c2: qty_w = st.number_input("Qty", 1, value=100, key="q_w", on_change=cb_focus_swing)
+    with c3: est_value("swing", sym_w, qty_w, "e_w")
+
+    st.markdown('<div class="stButton action-btn">', unsafe_allow_html=True)
+    st.button("🐢 Analyze Swing", use_container_width=True, on_click=cb_analyze_swing, key="btn_w")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if st.session_state.analyzed_swing:
+        with st.spinner("Analyzing..."):
+            d, _, macro = get_analysis_inputs(sym_w, with_news=False)
+            if not d: provider_error("yahoo", "Error.")
+            else:
+                df = d['hist']
+                curr_price = d['price']
+                fund = d['fund']
+                whales = d['whales']
+                st.markdown(f"""<div class="company-header"><p class="company-ticker">{sym_w}</p><p class="company-name">{d['name']}</p></div>""", unsafe_allow_html=True)
+
+                try:
+                    with metrics.timed("ind.swing"): ind = indicators.swing_snapshot(df)
+                    rsi_val = ind['rsi']
+                    bbl_val = ind['bb_lower']
+                    bbu_val = ind['bb_upper']
+                    vol_ratio = ind['vol_ratio']
+                except:
+                    rsi_val = 50
+                    bbl_val = curr_price * 0.95
+                    bbu_val = curr_price * 1.05
+                    vol_ratio = 100
+
+                macro_txt = f"VIX: {macro['vix']:.2f}" if macro else "N/A"
+                st.caption(macro_status_caption())
+
+                mk_cap = (fund['market_cap']/1e9) if fund['market_cap'] else 0
+                pe = fund['trailing_pe'] if fund['trailing_pe'] else 0
+                whale_str = ", ".join(whales) if whales else "None"
+
+                user_msg = swing_user_msg(sym_w, risk, mk_cap, pe, whale_str, rsi_val, vol_ratio, macro_txt)
+
+                ai_key = make_key(sym_w, "swing", {"mk_cap": mk_cap, "pe": pe, "whales": whale_str, "rsi": rsi_val, "vol_ratio": vol_ratio, "vix": macro['vix'] if macro else None},
+                                  risk=risk, earnings_date=d['earnings_date'])
+
+                verdict_ph = st.empty()
+
+                st.markdown('<div class="stButton action-btn">', unsafe_allow_html=True)
+                st.button("🔄 Check Another Stock", type="secondary", use_container_width=True, on_click=cb_home, key="reset_w_go")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Current", f"${curr_price:.2f}")
+                sl_ph, tp_ph = c2.empty(), c3.empty()
+
+                st.divider()
+                with st.expander("🧐 Full Report", expanded=True):
+                    if whales: st.info(f"🐳 **Whales:** {whale_str}")
+                    st.markdown("---")
+                    fund_ph = st.empty()
+                    st.markdown("---")
+                    tech_ph = st.empty()
+                    st.markdown("---")
+                    st.subheader("🏁 Conclusion")
+                    concl_ph = st.empty()
+
+                price_chart(sym_w, df, "chart_w")
+
+                def render_swing(ai, done):
+                    render_verdict(verdict_ph, ai, done, "#00CC7A", h1_style="color:white; ")
+                    render_price(sl_ph, "Stop Loss", ai.get('stop_loss'), bbl_val, done)
+                    render_price(tp_ph, "Target", ai.get('target'), bbu_val, done)
+                    render_list(fund_ph, ai.get('fund_analysis'), "No Data", done)
+                    render_list(tech_ph, ai.get('tech_analysis'), "No Data", done)
+                    render_list(concl_ph, ai.get('conclusion'), "No Data", done)
+
+                try: stream_ai(api_key, ai_key, sym_w, "swing", SWING_SYS_MSG, user_msg, render_swing)
+                except Exception as e:
+                    provider_error("openai", "AI analysis failed. Please try again.", e)
+                    st.stop()
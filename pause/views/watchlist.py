@@ -0,0 +1,46 @@
+import streamlit as st
+
+from pause.data import get_macro_data
+
+# ---------------------------------------------------------
+# TAB 3: WATCHLIST SCREEN (screener/pandas 는 실행 시점에 import)
+# ---------------------------------------------------------
+def render(api_key):
+    wl_text = st.text_area("Tickers (comma / space / newline separated)", "AAPL, MSFT, NVDA, TSLA, AMZN, META, GOOGL, AMD", key="wl_text", height=120)
+    c1, c2, c3 = st.columns(3)
+    with c1: wl_period = st.selectbox("History", ["3mo", "6mo", "1y"], index=1, key="wl_period")
+    with c2: wl_ai = st.number_input("AI verdict for top N (0 = off)", 0, 50, value=0, key="wl_ai")
+    with c3: wl_rpm = st.number_input("AI calls / min", 1, 60, value=20, key="wl_rpm")
+
+    st.markdown('<div class="stButton action-btn">', unsafe_allow_html=True)
+    run_screen = st.button("📋 Run Screen", use_container_width=True, key="btn_wl")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if run_screen:
+        from pause import screener
+        wl = screener.parse_watchlist(wl_text)
+        progress = st.progress(0.0, text=f"Screening {len(wl)} tickers...")
+        table = st.empty()
+        rows = []
+        for row in screener.screen(wl, wl_period):
+            rows.append(row)
+            progress.progress(len(rows) / max(len(wl), 1), text=f"{len(rows)}/{len(wl)} {row['ticker']}")
+            if len(rows) % 25 == 0: table.dataframe(rows, use_container_width=True, hide_index=True)
+        progress.empty()
+
+        if rows and wl_ai:
+            with st.spinner(f"AI verdict for top {wl_ai}..."):
+                macro = get_macro_data()
+                macro_txt = f"VIX: {macro['vix']:.2f}" if macro else "VIX: N/A"
+                verdicts = screener.ai_verdicts(rows, api_key, int(wl_ai), int(wl_rpm), macro_txt)
+            for r in rows: r["verdict"] = verdicts.get(r["ticker"], "")
+
+        st.session_state.wl_rows = rows
+        table.empty()
+
+    if st.session_state.get("wl_rows"):
+        from pause import screener
+        rows = st.session_state.wl_rows
+        st.caption(f"{len(rows)} tickers screened. Click a column header to sort.")
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.download_button("⬇️ Download CSV", screener.to_csv(rows), "screen.csv", "text/csv", key="wl_csv")
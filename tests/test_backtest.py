@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from pause.backtest import bracket_returns, entries
+
+
+def bars(*rows):
+    # (open, high, low, close) 봉 목록 -> 배열 4개
+    return [np.array(c, dtype=float) for c in zip(*rows)]
+
+
+def one(rows, target, stop, horizon=1):
+    o, h, l, c = bars(*rows)
+    n = len(c)
+    ret, hit, held = bracket_returns(c, np.full(n, target), np.full(n, stop), o, h, l, c, horizon)
+    return ret[0], bool(hit[0]), int(held[0])
+
+
+def test_stop_gap_fills_at_open():
+    assert one([(100, 100, 100, 100), (90, 90, 90, 90)], 102, 98) == (pytest.approx(-0.10), False, 1)
+
+
+def test_target_gap_fills_at_open():
+    assert one([(100, 100, 100, 100), (110, 111, 97, 105)], 102, 98) == (pytest.approx(0.10), True, 1)
+
+
+def test_both_inside_bar_prefers_stop():
+    assert one([(100, 100, 100, 100), (100, 103, 97, 101)], 102, 98) == (pytest.approx(-0.02), False, 1)
+
+
+def test_no_touch_exits_at_horizon_close():
+    assert one([(100, 100, 100, 100), (100, 101, 99, 100.5), (100, 101, 99, 99.5)], 102, 98, horizon=2) == (pytest.approx(-0.005), False, 2)
+
+
+def test_entries_skip_while_open():
+    sig = np.array([True, True, True, False, True])
+    held = np.array([2, 1, 3, 1, 1])
+    assert entries(sig, held).tolist() == [0, 2]
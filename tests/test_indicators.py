@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench.standins import Fixtures
+from pause import indicators
+from pause.indicators import IndicatorState
+
+FX = Fixtures()
+KEYS = ("price", "ema5", "stoch_k", "rsi", "bb_lower", "bb_upper", "vol_ratio")
+
+
+def pandas_last(df):
+    # 위 pandas 정의로 계산한 마지막 값 (기준)
+    close = df['Close']
+    bbl, bbu = indicators.bollinger(close)
+    return {
+        "price": close.iloc[-1],
+        "ema5": indicators.ema(close).iloc[-1],
+        "stoch_k": indicators.stochastic_k(df).iloc[-1],
+        "rsi": indicators.rsi(close).iloc[-1],
+        "bb_lower": bbl.iloc[-1],
+        "bb_upper": bbu.iloc[-1],
+        "vol_ratio": indicators.volume_ratio(df['Volume']).iloc[-1],
+    }
+
+
+def assert_matches(row, df):
+    want = pandas_last(df)
+    for k in KEYS: assert row[k] == pytest.approx(want[k], rel=1e-9), k
+    assert row["is_green"] == bool(df['Close'].iloc[-1] > df['Open'].iloc[-1])
+
+
+@pytest.mark.parametrize("symbol", FX.symbols)
+def test_snapshot_matches_pandas(symbol):
+    df = FX.history[symbol]
+    assert_matches(IndicatorState.from_frame(df).rows()["_"], df)
+
+
+def test_update_matches_pandas():
+    hists = {s: FX.history[s] for s in FX.symbols}
+    panel = indicators.make_panel(hists)
+    st = IndicatorState.from_panel({f: v.iloc[:-30] for f, v in panel.items()})
+    for i in range(len(panel['Close']) - 30, len(panel['Close'])):
+        st.update({f: v.iloc[i] for f, v in panel.items()})
+    rows = st.rows()
+    for s in FX.symbols: assert_matches(rows[s], pd.DataFrame({f: v[s] for f, v in panel.items()}).dropna())
+
+
+def test_missing_bar_does_not_leak_into_other_tickers():
+    # 한 종목만 3봉 전 봉이 빠져도 패널 결과는 그 종목 단독 계산과 같아야 함
+    a, b = FX.symbols[:2]
+    gap = FX.history[b].drop(FX.history[b].index[-3])
+    panel = indicators.make_panel({a: FX.history[a], b: gap})
+    assert panel['Close'][b].isna().sum() == 1
+    rows = IndicatorState.from_panel(panel).rows()
+    assert_matches(rows[a], FX.history[a])
+    assert_matches(rows[b], gap)
+    for k in KEYS: assert np.isfinite(rows[b][k]), k
+
+    # 빠진 봉을 update 로 넘겨도 같음
+    st = IndicatorState.from_panel({f: v.iloc[:-5] for f, v in panel.items()})
+    for i in range(len(panel['Close']) - 5, len(panel['Close'])):
+        st.update({f: v.iloc[i] for f, v in panel.items()})
+    assert_matches(st.rows()[b], gap)
@@ -0,0 +1,104 @@
+import json
+import zlib
+
+import pytest
+
+from bench.standins import StandIns
+from pause import llm
+from pause.llm import TokenBudget, _split_batch, chat_json_batch
+from pause.prompts import BATCH_SHORT_SYS_MSG, batch_user_msg
+from pause.scheduler import PROVIDER_LIMITS, Scheduler
+
+TICKERS = [f"T{i:02d}" for i in range(25)]
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # 가짜 모델 상대로는 제공자 속도 제한 없이
+    monkeypatch.setattr(llm, "scheduler", Scheduler({p: (1e9, 1e9) for p in PROVIDER_LIMITS}))
+
+
+def summaries(tickers=TICKERS):
+    return {t: f"{t} $100.0 EMA5 $99.0 {'BULLISH' if i % 2 else 'BEARISH'} Stoch 50 Vol 120% GREEN" for i, t in enumerate(tickers)}
+
+
+def test_split_batch_validates_entries():
+    ok = {"verdict": "GO", "stop_loss": "98", "target": 102, "reasoning": "up"}
+    data = {"results": [
+        dict(ok, ticker="aapl"),
+        dict(ok, ticker="AAPL", verdict="WAIT"),  # 중복 -> 첫 항목 유지
+        dict(ok, ticker="ZZZZ"),  # 요청하지 않은 종목
+        dict(ok, ticker="MSFT", verdict="BUY"),
+        dict(ok, ticker="NVDA", stop_loss="n/a"),
+        dict(ok, ticker="TSLA", target=None),
+        "garbage",
+    ]}
+    got = _split_batch(data, {"AAPL", "MSFT", "NVDA", "TSLA"})
+    assert got == {"AAPL": {"verdict": "GO", "stop_loss": 98.0, "target": 102.0, "reasoning": ["up"]}}
+    assert _split_batch({"results": "x"}, {"AAPL"}) == {}
+    assert _split_batch([], {"AAPL"}) == {}
+
+
+def test_batch_retries_only_failed_tickers():
+    s = StandIns(drop_every=3)
+    got = chat_json_batch(s.openai_client(), BATCH_SHORT_SYS_MSG, summaries(), lambda x: batch_user_msg(x, "VIX: 17.10"), batch_size=10)
+    assert sorted(got) == TICKERS
+    dropped = {t for t in TICKERS if zlib.crc32(t.encode()) % 3 == 0}
+    assert dropped
+    assert {t: n for t, n in s._seen.items() if n > 1} == {t: 2 for t in dropped}
+    assert s.calls["openai"] == 3 + -(-len(dropped) // 10)
+    assert got["T01"]["verdict"] == "GO" and got["T00"]["verdict"] == "WAIT"
+
+
+def test_batch_gives_up_after_retries():
+    s = StandIns()
+    client = s.openai_client()
+    create = client.chat.completions.create
+    def broken(**kw):
+        res = create(**kw)
+        data = json.loads(res.choices[0].message.content)
+        data["results"] = [r for r in data["results"] if r["ticker"] != "T03"]
+        res.choices[0].message.content = json.dumps(data)
+        return res
+    client.chat.completions.create = broken
+    got = chat_json_batch(client, BATCH_SHORT_SYS_MSG, summaries(TICKERS[:5]), lambda x: batch_user_msg(x, ""), retries=2)
+    assert sorted(got) == ["T00", "T01", "T02", "T04"]
+    assert s._seen["T03"] == 3 and s._seen["T00"] == 1
+
+
+class Clock:
+    def __init__(self): self.now, self.slept = 1000.0, 0.0
+    def monotonic(self): return self.now
+    def sleep(self, s): self.now += s; self.slept += s
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(llm.time, "monotonic", c.monotonic)
+    monkeypatch.setattr(llm.time, "sleep", c.sleep)
+    return c
+
+
+def test_budget_waits_for_window(clock):
+    b = TokenBudget(100)
+    b.wait(60)
+    clock.now += 10
+    b.wait(60)  # 첫 기록이 60초 창에서 빠질 때까지 대기
+    assert clock.slept == pytest.approx(50)
+
+
+def test_budget_adjust_replaces_estimate(clock):
+    b = TokenBudget(100)
+    b.adjust(b.wait(80), 20)
+    b.wait(70)
+    assert clock.slept == 0
+    # 실제 사용량이 추정보다 많으면 그만큼 더 기다림
+    b2 = TokenBudget(100)
+    b2.adjust(b2.wait(30), 90)
+    clock.now += 30
+    b2.wait(30)
+    assert clock.slept == pytest.approx(30)
+    # 보정은 원래 항목과 함께 만료 -> 창이 지나면 사용량 0
+    clock.now += 60
+    assert b2._used(clock.now) == 0